@@ -101,6 +101,17 @@ RUNNER_MAP: dict[str, Callable[..., RunResult]] = {
     "fireworks": run_fireworks_puzzle,
 }
 
+# Per-provider concurrency caps for parallel-all mode. Without them one
+# provider's long model list can monopolize the worker pool, and bursts of
+# simultaneous requests trip per-account rate limits.
+PROVIDER_CONCURRENCY: dict[str, int] = {
+    "openai": 8,
+    "anthropic": 8,
+    "gemini": 8,
+    "grok": 8,
+    "fireworks": 8,
+}
+
 # Default streaming settings per provider
 STREAM_DEFAULTS: dict[str, bool] = {
     "openai": True,
@@ -445,10 +456,20 @@ def run_parallel_all(
     puzzle_name: str,
     max_workers: int = 30,
     display: BatchDisplayManager | None = None,
+    provider_concurrency: dict[str, int] | None = None,
 ) -> list[ModelRunResult]:
-    """Run all models in parallel (up to max_workers)."""
+    """Run all models in parallel (up to max_workers).
+
+    Each runner provider is additionally capped by PROVIDER_CONCURRENCY
+    (overridable via provider_concurrency) so no single provider floods
+    its rate limit while the others idle.
+    """
     all_results: list[ModelRunResult] = []
     results_lock = threading.Lock()
+    limits = PROVIDER_CONCURRENCY | (provider_concurrency or {})
+    semaphores = {
+        provider: threading.Semaphore(limit) for provider, limit in limits.items()
+    }
 
     def status_callback(spec: ModelSpec, status: RunStatus) -> None:
         if display:
@@ -457,12 +478,16 @@ def run_parallel_all(
             _print_status(spec, status)
 
     def run_model(spec: ModelSpec) -> ModelRunResult:
-        result = run_single_model(
-            spec,
-            puzzle_name,
-            status_callback=status_callback,
-            quiet=True,
-        )
+        gate = semaphores.get(spec.runner_provider)
+        if gate is None:
+            gate = semaphores.setdefault(spec.runner_provider, threading.Semaphore(8))
+        with gate:
+            result = run_single_model(
+                spec,
+                puzzle_name,
+                status_callback=status_callback,
+                quiet=True,
+            )
         if display:
             if result.status == RunStatus.COMPLETED:
                 display.update(spec, RunStatus.COMPLETED)
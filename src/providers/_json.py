@@ -0,0 +1,24 @@
+"""Shared JSON helpers for the hot SSE/request paths.
+
+Prefers orjson (C-accelerated) when installed and falls back to the stdlib.
+``dumps`` returns UTF-8 bytes so callers can pass the result straight to
+request bodies and binary log handles without a separate encode step.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    loads = orjson.loads
+except ImportError:
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=True).encode("utf-8")
+
+    loads = json.loads
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
 import os
 from pathlib import Path
@@ -11,6 +12,7 @@ import urllib.error
 import urllib.request
 
 from src.costs import CostBreakdown, TokenBreakdown, compute_cost_breakdown
+from src.providers import _json
 
 
 DEFAULT_BASE_URL = "https://api.anthropic.com/v1/messages"
@@ -79,7 +81,9 @@ def require_api_key(env_var: str = "ANTHROPIC_API_KEY") -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=32)
 def price_schedule_for_model(model: str) -> dict[str, Any] | None:
+    # Memoized: callers treat the returned dict as read-only.
     schedule = PRICE_SCHEDULES_USD_PER_MILLION.get(model)
     if schedule is None:
         return None
@@ -168,6 +172,39 @@ def _system_blocks(system_prompt: str) -> list[dict[str, str]]:
     return [{"type": "text", "text": system_prompt}]
 
 
+@functools.lru_cache(maxsize=64)
+def _payload_scaffold(
+    model: str,
+    max_output_tokens: int | None,
+    temperature: float | None,
+    top_p: float | None,
+    top_k: int | None,
+    stream: bool | None,
+) -> dict[str, Any]:
+    """Build the prompt-free payload scaffold for one settings combination.
+
+    Default resolution and the optional sampling branches run once per
+    combination; the hot path is a cache hit plus a dict copy. Thinking
+    and output_config are dicts, so they are validated and applied per
+    call by build_messages_request.
+    """
+    if max_output_tokens is None:
+        defaults = MODEL_DEFAULTS.get(model, {})
+        max_output_tokens = defaults.get("max_output_tokens")
+    if max_output_tokens is None:
+        raise ValueError("max_output_tokens must be set for Anthropic requests")
+    payload: dict[str, Any] = {"model": model, "max_tokens": max_output_tokens}
+    if temperature is not None:
+        payload["temperature"] = temperature
+    if top_p is not None:
+        payload["top_p"] = top_p
+    if top_k is not None:
+        payload["top_k"] = top_k
+    if stream is not None:
+        payload["stream"] = stream
+    return payload
+
+
 def build_messages_request(
     *,
     system_prompt: str,
@@ -181,11 +218,10 @@ def build_messages_request(
     output_config: dict[str, Any] | None = None,
     stream: bool | None = None,
 ) -> dict[str, Any]:
-    if max_output_tokens is None:
-        defaults = MODEL_DEFAULTS.get(model, {})
-        max_output_tokens = defaults.get("max_output_tokens")
-    if max_output_tokens is None:
-        raise ValueError("max_output_tokens must be set for Anthropic requests")
+    scaffold = _payload_scaffold(
+        model, max_output_tokens, temperature, top_p, top_k, stream
+    )
+    max_output_tokens = scaffold["max_tokens"]
     if thinking is not None and (temperature is not None or top_k is not None):
         raise ValueError("Anthropic thinking is incompatible with temperature or top_k")
     if thinking is not None:
@@ -220,24 +256,13 @@ def build_messages_request(
         if effort is not None and not isinstance(effort, str):
             raise ValueError("Anthropic output_config.effort must be a string")
 
-    payload: dict[str, Any] = {
-        "model": model,
-        "max_tokens": max_output_tokens,
-        "system": _system_blocks(system_prompt),
-        "messages": [{"role": "user", "content": user_prompt}],
-    }
-    if temperature is not None:
-        payload["temperature"] = temperature
-    if top_p is not None:
-        payload["top_p"] = top_p
-    if top_k is not None:
-        payload["top_k"] = top_k
+    payload = scaffold.copy()
+    payload["system"] = _system_blocks(system_prompt)
+    payload["messages"] = [{"role": "user", "content": user_prompt}]
     if thinking is not None:
         payload["thinking"] = thinking
     if output_config is not None:
         payload["output_config"] = output_config
-    if stream is not None:
-        payload["stream"] = stream
     return payload
 
 
@@ -421,13 +446,14 @@ def send_messages_request(
                 sse_handle = None
                 if sse_event_path is not None:
                     sse_event_path.parent.mkdir(parents=True, exist_ok=True)
-                    sse_handle = sse_event_path.open("a", encoding="utf-8")
+                    # Binary append with a large buffer: one buffered write
+                    # per event instead of a syscall per event.
+                    sse_handle = sse_event_path.open("ab", buffering=1 << 20)
                 try:
                     for event in _iter_sse_events(response):
                         events.append(event)
                         if sse_handle is not None:
-                            sse_handle.write(json.dumps(event, ensure_ascii=True))
-                            sse_handle.write("\n")
+                            sse_handle.write(_json.dumps(event) + b"\n")
                         if progress_callback is None:
                             continue
                         data_payload = event.get("data")
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass
+import functools
+import hashlib
+import io
 import json
 import os
 from pathlib import Path
-from typing import Any, Callable
+import threading
+import time
+from typing import Any, Callable, Iterator
 
 from src.costs import CostBreakdown, TokenBreakdown, compute_cost_breakdown
 
+try:
+    # Prefer orjson (C-accelerated) for the hot streaming paths; fall back to
+    # stdlib json so the adapter works without the optional dependency.
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=True)
+
+    _json_loads = json.loads
+
+
+# Flush the SSE debug log every N buffered events instead of once per chunk.
+_SSE_FLUSH_EVENTS = 64
 
 CANONICAL_MODELS: dict[str, str] = {
     "deepseek-v3p2": "accounts/fireworks/models/deepseek-v3p2",
@@ -35,9 +59,11 @@ MODEL_DEFAULTS: dict[str, dict[str, int | None]] = {
     "accounts/fireworks/models/llama-v3p3-70b-instruct": {"max_output_tokens": 8192},
 }
 
-SUPPORTED_MODELS: set[str] = set(MODEL_DEFAULTS.keys()) | set(CANONICAL_MODELS.keys())
+SUPPORTED_MODELS: frozenset[str] = frozenset(MODEL_DEFAULTS) | frozenset(
+    CANONICAL_MODELS
+)
 
-REASONING_MODELS: set[str] = {
+REASONING_MODELS: frozenset[str] = frozenset({
     "accounts/fireworks/models/deepseek-v3p2",
     "deepseek-v3p2",
     "accounts/fireworks/models/deepseek-v3p1",
@@ -48,7 +74,7 @@ REASONING_MODELS: set[str] = {
     "kimi-k2p5",
     "accounts/fireworks/models/kimi-k2-instruct-0905",
     "kimi-k2-instruct-0905",
-}
+})
 
 PRICE_SCHEDULES_USD_PER_MILLION: dict[str, dict[str, float | None]] = {
     "accounts/fireworks/models/deepseek-v3p2": {
@@ -140,6 +166,31 @@ PROVIDER_ALIASES: dict[str, str] = {
     "fireworks": "Fireworks",
 }
 
+# Flattened lookup tables keyed by every accepted name (alias and canonical)
+# so the accessors below resolve in a single dict probe.
+_PROVIDER_BY_ANY_NAME: dict[str, str] = {
+    name: MODEL_PROVIDERS.get(CANONICAL_MODELS.get(name, name), "fireworks")
+    for name in SUPPORTED_MODELS
+}
+
+_PRICE_BY_ANY_NAME: dict[str, dict[str, Any]] = {
+    name: {
+        "currency": "usd",
+        "unit": "per_million_tokens",
+        "input": schedule["input"],
+        "input_cached": schedule.get("input_cached"),
+        "output": schedule["output"],
+    }
+    for name in SUPPORTED_MODELS
+    if (schedule := PRICE_SCHEDULES_USD_PER_MILLION.get(CANONICAL_MODELS.get(name, name)))
+    is not None
+}
+
+_MAX_TOKENS_BY_ANY_NAME: dict[str, int | None] = {
+    name: MODEL_DEFAULTS.get(CANONICAL_MODELS.get(name, name), {}).get("max_output_tokens")
+    for name in SUPPORTED_MODELS
+}
+
 
 @dataclass(frozen=True)
 class FireworksResponse:
@@ -156,8 +207,7 @@ def require_api_key(env_var: str = "FIREWORKS_API_KEY") -> str:
 
 
 def provider_for_model(model: str) -> str:
-    model_id = CANONICAL_MODELS.get(model, model)
-    return MODEL_PROVIDERS.get(model_id, "fireworks")
+    return _PROVIDER_BY_ANY_NAME.get(model, "fireworks")
 
 
 def resolve_model(model: str) -> str:
@@ -170,17 +220,13 @@ def storage_model_name(model: str) -> str:
     return REVERSE_CANONICAL_MODELS.get(model, model)
 
 
+@functools.lru_cache(maxsize=32)
 def price_schedule_for_model(model: str) -> dict[str, Any] | None:
-    schedule = PRICE_SCHEDULES_USD_PER_MILLION.get(resolve_model(model))
+    # Memoized: callers treat the returned dict as read-only.
+    schedule = _PRICE_BY_ANY_NAME.get(model)
     if schedule is None:
         return None
-    return {
-        "currency": "usd",
-        "unit": "per_million_tokens",
-        "input": schedule["input"],
-        "input_cached": schedule.get("input_cached"),
-        "output": schedule["output"],
-    }
+    return dict(schedule)
 
 
 def display_model_name(model: str) -> str:
@@ -224,8 +270,7 @@ def build_chat_completion_request(
 ) -> dict[str, Any]:
     model_id = resolve_model(model)
     if max_output_tokens is None:
-        defaults = MODEL_DEFAULTS.get(model_id, {})
-        max_output_tokens = defaults.get("max_output_tokens")
+        max_output_tokens = _MAX_TOKENS_BY_ANY_NAME.get(model_id)
 
     # Default to enabling reasoning for reasoning models
     if reasoning_effort is None:
@@ -251,24 +296,55 @@ def build_chat_completion_request(
     return payload
 
 
+# Dumper resolved once per SDK type, so repeat chunks pay one dict probe
+# instead of the getattr cascade below.
+_DUMP_CACHE: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
+def _resolve_dumper(cls: type) -> Callable[[Any], dict[str, Any]]:
+    if callable(getattr(cls, "model_dump_json", None)):
+        # Pydantic v2's C-accelerated model_dump_json plus a fast parse beats
+        # the Python-level model_dump(mode="json") traversal.
+        def dump(value: Any) -> dict[str, Any]:
+            try:
+                return _json_loads(
+                    value.model_dump_json(exclude_none=True, warnings="none")
+                )
+            except TypeError:
+                return value.model_dump()
+
+        return dump
+    if callable(getattr(cls, "model_dump", None)):
+        def dump(value: Any) -> dict[str, Any]:
+            try:
+                return value.model_dump(mode="json", exclude_none=True, warnings="none")
+            except TypeError:
+                return value.model_dump()
+
+        return dump
+    if callable(getattr(cls, "dict", None)):
+        return lambda value: value.dict()
+    raise TypeError(f"Unsupported Fireworks payload type: {cls!r}")
+
+
 def _model_dump(value: Any) -> dict[str, Any]:
     """Convert SDK response objects to dictionaries."""
-    if isinstance(value, dict):
+    cls = type(value)
+    if cls is dict:
         return value
-    dump = getattr(value, "model_dump", None)
-    if callable(dump):
-        try:
-            return dump(mode="json", exclude_none=True, warnings="none")
-        except TypeError:
-            return dump()
-    legacy_dump = getattr(value, "dict", None)
-    if callable(legacy_dump):
-        return legacy_dump()
-    raise TypeError(f"Unsupported Fireworks payload type: {type(value)!r}")
+    dumper = _DUMP_CACHE.get(cls)
+    if dumper is None:
+        if isinstance(value, dict):
+            return value
+        dumper = _DUMP_CACHE[cls] = _resolve_dumper(cls)
+    return dumper(value)
 
 
 def extract_usage_breakdown(payload: dict[str, Any]) -> TokenBreakdown | None:
-    usage = payload.get("usage")
+    try:
+        usage = payload["usage"]
+    except KeyError:
+        return None
     if not isinstance(usage, dict):
         return None
     input_tokens = usage.get("prompt_tokens")
@@ -312,28 +388,45 @@ def extract_output_text(payload: dict[str, Any]) -> str:
     For Qwen models that use </think> tags, exclude thinking content
     and return only the main response after the tag.
     """
-    choices = payload.get("choices")
-    if not isinstance(choices, list):
-        return ""
-    for choice in choices:
-        if not isinstance(choice, dict):
-            continue
-        message = choice.get("message")
-        if not isinstance(message, dict):
-            continue
-        content = message.get("content")
-        if isinstance(content, str):
-            # Check if this is a Qwen model response with </think> tag
-            think_end = content.find("</think>")
-            if think_end != -1:
-                # Return everything after </think>, stripping leading whitespace
-                return content[think_end + len("</think>"):].lstrip()
-            return content
-    return ""
+    # Fast path: well-formed responses put the text at choices[0].message.content.
+    try:
+        content = payload["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        content = None
+    if not isinstance(content, str):
+        choices = payload.get("choices")
+        if not isinstance(choices, list):
+            return ""
+        content = None
+        for choice in choices:
+            if not isinstance(choice, dict):
+                continue
+            message = choice.get("message")
+            if not isinstance(message, dict):
+                continue
+            candidate = message.get("content")
+            if isinstance(candidate, str):
+                content = candidate
+                break
+        if content is None:
+            return ""
+    # Check if this is a Qwen model response with </think> tag
+    think_end = content.find("</think>")
+    if think_end != -1:
+        # Return everything after </think>, stripping leading whitespace
+        return content[think_end + len("</think>"):].lstrip()
+    return content
 
 
 def extract_reasoning_content(payload: dict[str, Any]) -> str | None:
     """Extract reasoning content from a chat completion response."""
+    # Fast path mirroring extract_output_text for well-formed responses.
+    try:
+        reasoning = payload["choices"][0]["message"]["reasoning_content"]
+    except (KeyError, IndexError, TypeError):
+        reasoning = None
+    if isinstance(reasoning, str) and reasoning:
+        return reasoning
     choices = payload.get("choices")
     if not isinstance(choices, list):
         return None
@@ -349,62 +442,76 @@ def extract_reasoning_content(payload: dict[str, Any]) -> str | None:
     return None
 
 
-def _reconstruct_stream_payload(
-    events: list[dict[str, Any]],
-    *,
-    content_chunks: list[str],
-    reasoning_chunks: list[str],
-    model: str | None,
-) -> dict[str, Any]:
-    """Reconstruct a complete response payload from stream events."""
-    response_payload: dict[str, Any] = {}
-    finish_reason: str | None = None
-    choice_index: int | None = None
-    role = "assistant"
-
-    for event in events:
-        if "id" in event:
-            response_payload["id"] = event.get("id")
-        if "created" in event:
-            response_payload["created"] = event.get("created")
-        if "model" in event:
-            response_payload["model"] = event.get("model")
-        if "system_fingerprint" in event:
-            response_payload["system_fingerprint"] = event.get("system_fingerprint")
-        if isinstance(event.get("usage"), dict):
-            response_payload["usage"] = event.get("usage")
-
-        choices = event.get("choices")
-        if not isinstance(choices, list):
-            continue
-        for choice in choices:
-            if not isinstance(choice, dict):
+# Header fields copied from stream events into the reconstructed payload.
+_STREAM_META_KEYS = ("id", "created", "model", "system_fingerprint")
+
+
+_API_BASE_URL = "https://api.fireworks.ai/inference/v1"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_http_client(api_key: str) -> Any | None:
+    """Return a persistent httpx client for the raw streaming transport.
+
+    Posting JSON directly to the chat completions endpoint skips the SDK's
+    pydantic round-tripping on the hot stream path. HTTP/2 is enabled when
+    the optional ``h2`` package is installed so concurrent streams can share
+    one connection. Returns None when httpx is not installed, in which case
+    callers fall back to the Fireworks SDK.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    limits = httpx.Limits(max_keepalive_connections=32)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream",
+    }
+    try:
+        return httpx.Client(
+            base_url=_API_BASE_URL, http2=True, limits=limits, headers=headers
+        )
+    except ImportError:
+        return httpx.Client(base_url=_API_BASE_URL, limits=limits, headers=headers)
+
+
+def _iter_httpx_stream(
+    client: Any, payload: dict[str, Any], timeout_s: float
+) -> Iterator[dict[str, Any]]:
+    """Yield parsed SSE event payloads from a raw streaming POST."""
+    with client.stream(
+        "POST", "/chat/completions", content=_json_dumps(payload), timeout=timeout_s
+    ) as response:
+        if response.status_code != 200:
+            response.read()
+            raise RuntimeError(
+                f"Fireworks API error {response.status_code}: {response.text}"
+            )
+        for line in response.iter_lines():
+            if not line or line.startswith(":"):
                 continue
-            if choice_index is None and isinstance(choice.get("index"), int):
-                choice_index = choice.get("index")
-            delta = choice.get("delta")
-            if isinstance(delta, dict) and isinstance(delta.get("role"), str):
-                role = delta.get("role")
-            if choice.get("finish_reason") is not None:
-                finish_reason = choice.get("finish_reason")
-
-    payload_model = response_payload.get("model")
-    if not isinstance(payload_model, str) and isinstance(model, str):
-        response_payload["model"] = model
-    response_payload["object"] = "chat.completion"
-
-    message: dict[str, Any] = {"role": role, "content": "".join(content_chunks)}
-    if reasoning_chunks:
-        message["reasoning_content"] = "".join(reasoning_chunks)
-
-    response_payload["choices"] = [
-        {
-            "index": choice_index if isinstance(choice_index, int) else 0,
-            "message": message,
-            "finish_reason": finish_reason,
-        }
-    ]
-    return response_payload
+            if line.startswith("data:"):
+                data = line[len("data:"):].lstrip()
+                if data == "[DONE]":
+                    break
+                yield _json_loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str) -> Any:
+    """Return a shared Fireworks client for this key.
+
+    Reusing the client keeps the SDK's underlying HTTP connection pool (and
+    its TLS sessions) alive across sequential requests. Callers must treat
+    the client as read-only.
+    """
+    # Lazy import to avoid requiring SDK for response reading
+    from fireworks import Fireworks
+
+    return Fireworks(api_key=api_key)
 
 
 def send_chat_completion_request(
@@ -417,34 +524,72 @@ def send_chat_completion_request(
     stream_reasoning_callback: Callable[[str], None] | None = None,
     sse_event_path: Path | None = None,
     stream_capture: dict[str, Any] | None = None,
+    reconstruct: bool = True,
+    stream_callback_min_chars: int = 64,
+    stream_callback_min_interval_s: float = 0.05,
 ) -> dict[str, Any]:
-    """Send a chat completion request using the Fireworks SDK."""
-    # Lazy import to avoid requiring SDK for response reading
-    from fireworks import Fireworks
+    """Send a chat completion request using the Fireworks SDK.
 
+    With ``reconstruct=False`` (streaming only), the per-event metadata pass
+    and final chat.completion-shaped assembly are skipped; callers that read
+    the chunks from ``stream_capture`` get back a minimal payload carrying
+    just the usage block and model name.
+    """
     try:
-        client = Fireworks(api_key=api_key)
-
         if payload.get("stream") is True:
-            events: list[dict[str, Any]] = []
-            content_chunks: list[str] = []
-            reasoning_chunks: list[str] = []
+            http_client = _get_http_client(api_key)
+            if http_client is not None:
+                # Raw transport: events arrive as already-parsed dicts.
+                event_iter = _iter_httpx_stream(http_client, payload, timeout_s)
+            else:
+                stream = _get_client(api_key).chat.completions.create(
+                    **payload, timeout=timeout_s
+                )
+                event_iter = (_model_dump(chunk) for chunk in stream)
+
+            # StringIO accumulators avoid the per-chunk list bookkeeping and
+            # the big final join on long-reasoning outputs.
+            content_buf = io.StringIO()
+            reasoning_buf = io.StringIO()
             streamed_chars = 0
 
+            # Callback coalescing: deltas arrive a few tokens at a time, so
+            # text/progress callbacks fire only every N chars or M seconds.
+            notify = stream_text_callback is not None or progress_callback is not None
+            pending_text: list[str] = []
+            pending_chars = 0
+            last_flush = time.monotonic()
+
+            # Response metadata is accumulated in the same pass as the deltas
+            # so no second walk over the events is needed at stream end.
+            response_payload: dict[str, Any] = {}
+            finish_reason: str | None = None
+            choice_index: int | None = None
+            role = "assistant"
+
             sse_handle = None
+            sse_buffer: list[str] = []
             if sse_event_path is not None:
                 sse_event_path.parent.mkdir(parents=True, exist_ok=True)
-                sse_handle = sse_event_path.open("a", encoding="utf-8")
+                sse_handle = sse_event_path.open("a", encoding="utf-8", buffering=1 << 20)
 
             try:
-                stream = client.chat.completions.create(**payload, timeout=timeout_s)
-                for chunk in stream:
-                    event_payload = _model_dump(chunk)
-                    events.append(event_payload)
-
+                for event_payload in event_iter:
                     if sse_handle is not None:
-                        sse_handle.write(json.dumps(event_payload, ensure_ascii=True))
-                        sse_handle.write("\n")
+                        # Batch serialized events so the receive loop is not
+                        # paying one write per token-level chunk.
+                        sse_buffer.append(_json_dumps(event_payload))
+                        if len(sse_buffer) >= _SSE_FLUSH_EVENTS:
+                            sse_handle.write("\n".join(sse_buffer) + "\n")
+                            sse_buffer.clear()
+
+                    if reconstruct:
+                        for key in _STREAM_META_KEYS:
+                            if key in event_payload:
+                                response_payload[key] = event_payload[key]
+                    usage = event_payload.get("usage")
+                    if isinstance(usage, dict):
+                        response_payload["usage"] = usage
 
                     choices = event_payload.get("choices")
                     if not isinstance(choices, list):
@@ -453,46 +598,91 @@ def send_chat_completion_request(
                     for choice in choices:
                         if not isinstance(choice, dict):
                             continue
+                        if choice_index is None and isinstance(choice.get("index"), int):
+                            choice_index = choice.get("index")
+                        if choice.get("finish_reason") is not None:
+                            finish_reason = choice.get("finish_reason")
                         delta = choice.get("delta")
                         if not isinstance(delta, dict):
                             continue
+                        if isinstance(delta.get("role"), str):
+                            role = delta.get("role")
 
                         # Handle reasoning content
                         reasoning = delta.get("reasoning_content")
                         if isinstance(reasoning, str) and reasoning:
-                            reasoning_chunks.append(reasoning)
+                            reasoning_buf.write(reasoning)
                             if stream_reasoning_callback is not None:
                                 stream_reasoning_callback(reasoning)
 
                         # Handle regular content
                         content = delta.get("content")
                         if isinstance(content, str) and content:
-                            content_chunks.append(content)
+                            content_buf.write(content)
                             streamed_chars += len(content)
-                            if stream_text_callback is not None:
-                                stream_text_callback(content)
-                            if progress_callback is not None:
-                                progress_callback(streamed_chars)
+                            if notify:
+                                pending_text.append(content)
+                                pending_chars += len(content)
+                                now = time.monotonic()
+                                if (
+                                    pending_chars >= stream_callback_min_chars
+                                    or now - last_flush
+                                    >= stream_callback_min_interval_s
+                                ):
+                                    if stream_text_callback is not None:
+                                        stream_text_callback("".join(pending_text))
+                                    if progress_callback is not None:
+                                        progress_callback(streamed_chars)
+                                    pending_text.clear()
+                                    pending_chars = 0
+                                    last_flush = now
+
+                if notify and pending_text:
+                    if stream_text_callback is not None:
+                        stream_text_callback("".join(pending_text))
+                    if progress_callback is not None:
+                        progress_callback(streamed_chars)
+                    pending_text.clear()
 
             finally:
                 if sse_handle is not None:
+                    if sse_buffer:
+                        sse_handle.write("\n".join(sse_buffer) + "\n")
                     sse_handle.close()
 
-            # Store reasoning in stream_capture for runner to extract
+            content_text = content_buf.getvalue()
+            reasoning_text = reasoning_buf.getvalue()
+
+            # Store accumulated text in stream_capture for runner to extract
             if stream_capture is not None:
-                stream_capture["reasoning_chunks"] = reasoning_chunks
-                stream_capture["content_chunks"] = content_chunks
-
-            response_payload = _reconstruct_stream_payload(
-                events,
-                content_chunks=content_chunks,
-                reasoning_chunks=reasoning_chunks,
-                model=payload.get("model") if isinstance(payload.get("model"), str) else None,
-            )
+                stream_capture["reasoning_text"] = reasoning_text
+                stream_capture["content_text"] = content_text
+
+            if not isinstance(response_payload.get("model"), str) and isinstance(
+                payload.get("model"), str
+            ):
+                response_payload["model"] = payload["model"]
+            if not reconstruct:
+                return response_payload
+            response_payload["object"] = "chat.completion"
+
+            message: dict[str, Any] = {"role": role, "content": content_text}
+            if reasoning_text:
+                message["reasoning_content"] = reasoning_text
+
+            response_payload["choices"] = [
+                {
+                    "index": choice_index if isinstance(choice_index, int) else 0,
+                    "message": message,
+                    "finish_reason": finish_reason,
+                }
+            ]
             return response_payload
 
         # Non-streaming request
-        response = client.chat.completions.create(**payload, timeout=timeout_s)
+        response = _get_client(api_key).chat.completions.create(
+            **payload, timeout=timeout_s
+        )
         return _model_dump(response)
 
     except Exception as exc:
@@ -500,6 +690,18 @@ def send_chat_completion_request(
         raise RuntimeError(f"Fireworks API error: {exc}") from exc
 
 
+# In-flight deduplication: concurrent callers issuing an identical request
+# (common in deterministic sweeps) share one API call instead of two.
+_inflight: dict[str, Future[dict[str, Any]]] = {}
+_inflight_lock = threading.Lock()
+
+
+def _request_key(payload: dict[str, Any]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_json_dumps(payload).encode("utf-8"))
+    return digest.hexdigest()
+
+
 def create_chat_completion(
     *,
     system_prompt: str,
@@ -513,6 +715,7 @@ def create_chat_completion(
     sse_event_path: Path | None = None,
     api_key: str | None = None,
     timeout_s: float = 600,
+    dedupe: bool = False,
 ) -> FireworksResponse:
     payload = build_chat_completion_request(
         system_prompt=system_prompt,
@@ -524,12 +727,42 @@ def create_chat_completion(
         reasoning_effort=reasoning_effort,
         stream=stream,
     )
-    response_payload = send_chat_completion_request(
-        payload,
-        api_key=api_key or require_api_key(),
-        timeout_s=timeout_s,
-        sse_event_path=sse_event_path,
-    )
+    resolved_api_key = api_key or require_api_key()
+
+    if dedupe:
+        key = _request_key(payload)
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _inflight[key] = future
+        if not owner:
+            response_payload = future.result()
+        else:
+            try:
+                response_payload = send_chat_completion_request(
+                    payload,
+                    api_key=resolved_api_key,
+                    timeout_s=timeout_s,
+                    sse_event_path=sse_event_path,
+                )
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            else:
+                future.set_result(response_payload)
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(key, None)
+    else:
+        response_payload = send_chat_completion_request(
+            payload,
+            api_key=resolved_api_key,
+            timeout_s=timeout_s,
+            sse_event_path=sse_event_path,
+        )
+
     return FireworksResponse(
         payload=response_payload,
         output_text=extract_output_text(response_payload),
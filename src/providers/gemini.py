@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Any, Callable
 
 from src.costs import CostBreakdown, TokenBreakdown, compute_cost_breakdown
+from src.providers import _json
 
 
 MODEL_ALIASES: dict[str, str] = {
@@ -75,7 +77,9 @@ def require_api_key() -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=32)
 def price_schedule_for_model(model: str) -> dict[str, Any] | None:
+    # Memoized: callers treat the returned dict as read-only.
     schedule = PRICE_SCHEDULES_USD_PER_MILLION.get(model)
     if schedule is None:
         return None
@@ -141,19 +145,21 @@ def calculate_cost_breakdown(payload: dict[str, Any], *, model: str) -> CostBrea
     return compute_cost_breakdown(tokens, schedule, output_includes_reasoning=False)
 
 
-def build_generate_content_request(
-    *,
-    system_prompt: str,
-    user_prompt: str,
+@functools.lru_cache(maxsize=64)
+def _config_scaffold(
     model: str,
-    max_output_tokens: int | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    top_k: int | None = None,
-    thinking_config: dict[str, Any] | None = None,
-    tools: list[dict[str, Any]] | None = None,
+    max_output_tokens: int | None,
+    temperature: float | None,
+    top_p: float | None,
+    top_k: int | None,
 ) -> dict[str, Any]:
-    config: dict[str, Any] = {"system_instruction": system_prompt}
+    """Build the sampling portion of the config for one settings combination.
+
+    Default resolution and the optional branches run once per combination;
+    thinking_config and tools are dicts/lists, so they are applied per call
+    by build_generate_content_request.
+    """
+    config: dict[str, Any] = {}
     if max_output_tokens is None:
         defaults = MODEL_DEFAULTS.get(model, {})
         max_output_tokens = defaults.get("max_output_tokens")
@@ -165,6 +171,25 @@ def build_generate_content_request(
         config["top_p"] = top_p
     if top_k is not None:
         config["top_k"] = top_k
+    return config
+
+
+def build_generate_content_request(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    max_output_tokens: int | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    top_k: int | None = None,
+    thinking_config: dict[str, Any] | None = None,
+    tools: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    config = {
+        "system_instruction": system_prompt,
+        **_config_scaffold(model, max_output_tokens, temperature, top_p, top_k),
+    }
     if thinking_config:
         config["thinking_config"] = thinking_config
     if tools:
@@ -280,7 +305,9 @@ def send_generate_content_request(
                 sse_handle = None
                 if sse_event_path is not None:
                     sse_event_path.parent.mkdir(parents=True, exist_ok=True)
-                    sse_handle = sse_event_path.open("a", encoding="utf-8")
+                    # Binary append with a large buffer: one buffered write
+                    # per event instead of a syscall per event.
+                    sse_handle = sse_event_path.open("ab", buffering=1 << 20)
                 try:
                     for chunk in client.models.generate_content_stream(
                         model=payload["model"],
@@ -289,8 +316,7 @@ def send_generate_content_request(
                     ):
                         chunk_payload = _serialize_response(chunk)
                         if sse_handle is not None:
-                            sse_handle.write(json.dumps(chunk_payload, ensure_ascii=True))
-                            sse_handle.write("\n")
+                            sse_handle.write(_json.dumps(chunk_payload) + b"\n")
                         for part in _extract_part_entries(chunk_payload):
                             text = part["text"]
                             is_thought = part["thought"]
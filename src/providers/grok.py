@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
+import functools
+import http.client
+import io
 import os
 from pathlib import Path
+import threading
 from typing import Any, Callable, Iterator
-import urllib.error
-import urllib.request
+import urllib.parse
 
 from src.costs import CostBreakdown, TokenBreakdown, compute_cost_breakdown
+from src.providers import _json
 
 
 DEFAULT_BASE_URL = "https://api.x.ai/v1/chat/completions"
@@ -61,7 +64,9 @@ def require_api_key(env_var: str = "XAI_API_KEY") -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=32)
 def price_schedule_for_model(model: str) -> dict[str, Any] | None:
+    # Memoized: callers treat the returned dict as read-only.
     schedule = PRICE_SCHEDULES_USD_PER_MILLION.get(model)
     if schedule is None:
         return None
@@ -73,10 +78,12 @@ def price_schedule_for_model(model: str) -> dict[str, Any] | None:
     }
 
 
+@functools.lru_cache(maxsize=16)
 def display_model_name(model: str) -> str:
     return MODEL_ALIASES.get(model, model)
 
 
+@functools.lru_cache(maxsize=16)
 def display_provider_name(provider: str) -> str:
     return PROVIDER_ALIASES.get(provider, provider)
 
@@ -98,28 +105,36 @@ def supports_model(model: str) -> bool:
 
 def extract_usage_breakdown(payload: dict[str, Any]) -> TokenBreakdown | None:
     usage = payload.get("usage")
-    if not isinstance(usage, dict):
+    if type(usage) is not dict:
         return None
+    # Key fallbacks stay as explicit type checks (not `or` chains) so a
+    # legitimate zero-token count is never skipped over.
     input_tokens = usage.get("prompt_tokens")
-    if not isinstance(input_tokens, int):
+    if type(input_tokens) is not int:
         input_tokens = usage.get("input_tokens")
+        if type(input_tokens) is not int:
+            input_tokens = None
     output_tokens = usage.get("completion_tokens")
-    if not isinstance(output_tokens, int):
+    if type(output_tokens) is not int:
         output_tokens = usage.get("output_tokens")
+        if type(output_tokens) is not int:
+            output_tokens = None
     reasoning_tokens = None
-    for details in (
-        usage.get("completion_tokens_details"),
-        usage.get("output_tokens_details"),
-    ):
-        if isinstance(details, dict):
+    details = usage.get("completion_tokens_details")
+    if type(details) is dict:
+        candidate = details.get("reasoning_tokens")
+        if type(candidate) is int:
+            reasoning_tokens = candidate
+    if reasoning_tokens is None:
+        details = usage.get("output_tokens_details")
+        if type(details) is dict:
             candidate = details.get("reasoning_tokens")
-            if isinstance(candidate, int):
+            if type(candidate) is int:
                 reasoning_tokens = candidate
-                break
     return TokenBreakdown(
-        input_tokens=input_tokens if isinstance(input_tokens, int) else None,
+        input_tokens=input_tokens,
         reasoning_tokens=reasoning_tokens,
-        output_tokens=output_tokens if isinstance(output_tokens, int) else None,
+        output_tokens=output_tokens,
     )
 
 
@@ -133,27 +148,23 @@ def calculate_cost_breakdown(payload: dict[str, Any], *, model: str) -> CostBrea
     return compute_cost_breakdown(tokens, schedule, output_includes_reasoning=True)
 
 
-def build_chat_completion_request(
-    *,
-    system_prompt: str,
-    user_prompt: str,
+@functools.lru_cache(maxsize=64)
+def _payload_scaffold(
     model: str,
-    max_output_tokens: int | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    stream: bool | None = None,
+    max_output_tokens: int | None,
+    temperature: float | None,
+    top_p: float | None,
+    stream: bool | None,
 ) -> dict[str, Any]:
+    """Build the message-free payload scaffold for one settings combination.
+
+    Call sites tend to pass the same options every time, so the optional
+    branches run once per combination; the hot path is a cache hit plus a
+    dict copy.
+    """
     if max_output_tokens is None:
-        defaults = MODEL_DEFAULTS.get(model, {})
-        max_output_tokens = defaults.get("max_output_tokens")
-
-    payload: dict[str, Any] = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-    }
+        max_output_tokens = MODEL_DEFAULTS.get(model, {}).get("max_output_tokens")
+    payload: dict[str, Any] = {"model": model}
     if max_output_tokens is not None:
         payload["max_tokens"] = max_output_tokens
     if temperature is not None:
@@ -165,96 +176,111 @@ def build_chat_completion_request(
     return payload
 
 
+def build_chat_completion_request(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    max_output_tokens: int | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    stream: bool | None = None,
+) -> dict[str, Any]:
+    payload = _payload_scaffold(
+        model, max_output_tokens, temperature, top_p, stream
+    ).copy()
+    payload["messages"] = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+    return payload
+
+
+# SSE framing constants, hoisted so the per-line loop compares against
+# preallocated bytes objects (and a single int for the comment marker).
+_DATA_PREFIX = b"data:"
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_DONE = b"[DONE]"
+
+_stream_local = threading.local()
+
+
+def _event_data_bytes(event_bytes: bytes) -> bytes | None:
+    """Extract the joined ``data:`` payload bytes from one SSE event."""
+    # splitlines runs at the C level and handles CRLF, so the prefix filter
+    # is the only per-line Python work (comment/blank lines fail it too).
+    data_lines = [
+        line[_DATA_PREFIX_LEN:].lstrip()
+        for line in event_bytes.splitlines()
+        if line.startswith(_DATA_PREFIX)
+    ]
+    if not data_lines:
+        return None
+    return b"\n".join(data_lines)
+
+
+def _borrow_stream_buffer() -> bytearray:
+    """Return this thread's reusable SSE buffer, cleared for a new stream.
+
+    Each thread streams at most one response at a time, so reusing a single
+    bytearray avoids regrowing a fresh buffer on every request.
+    """
+    buf = getattr(_stream_local, "buffer", None)
+    if buf is None:
+        buf = _stream_local.buffer = bytearray()
+    else:
+        del buf[:]
+    return buf
+
+
 def _iter_sse_events(response: Any) -> Iterator[dict[str, Any]]:
-    data_lines: list[str] = []
+    """Yield parsed SSE events from a byte stream.
+
+    Reads the response in large blocks and scans for blank-line event
+    boundaries at the bytes level, so only each event's data payload is
+    decoded (inside the JSON parser) rather than every line.
+    """
+    read = getattr(response, "read1", response.read)
+    buf = _borrow_stream_buffer()
     while True:
-        line_bytes = response.readline()
-        if not line_bytes:
-            if data_lines:
-                data = "\n".join(data_lines)
-                data_lines = []
-                if data == "[DONE]":
-                    break
-                yield _parse_sse_data(data)
+        chunk = read(65536)
+        if not chunk:
             break
-        line = line_bytes.decode("utf-8", errors="replace").rstrip("\r\n")
-        if not line:
-            if data_lines:
-                data = "\n".join(data_lines)
-                data_lines = []
-                if data == "[DONE]":
-                    break
-                yield _parse_sse_data(data)
-            continue
-        if line.startswith(":"):
-            continue
-        if line.startswith("data:"):
-            data_lines.append(line[len("data:"):].lstrip())
+        buf += chunk
+        while True:
+            lf_idx = buf.find(b"\n\n")
+            crlf_idx = buf.find(b"\r\n\r\n")
+            if crlf_idx != -1 and (lf_idx == -1 or crlf_idx < lf_idx):
+                event_bytes = bytes(buf[:crlf_idx])
+                del buf[: crlf_idx + 4]
+            elif lf_idx != -1:
+                event_bytes = bytes(buf[:lf_idx])
+                del buf[: lf_idx + 2]
+            else:
+                break
+            data = _event_data_bytes(event_bytes)
+            if data is None:
+                continue
+            if data == _DONE:
+                return
+            yield _parse_sse_data(data)
+    data = _event_data_bytes(bytes(buf))
+    if data is not None and data != _DONE:
+        yield _parse_sse_data(data)
 
 
-def _parse_sse_data(data: str) -> dict[str, Any]:
+def _parse_sse_data(data: bytes) -> dict[str, Any]:
     try:
-        parsed = json.loads(data)
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"Failed to parse Grok stream event: {data}") from exc
+        parsed = _json.loads(data)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"Failed to parse Grok stream event: {data.decode('utf-8', errors='replace')}"
+        ) from exc
     if not isinstance(parsed, dict):
         raise RuntimeError(f"Unexpected Grok stream event payload: {parsed}")
     return parsed
 
 
-def _reconstruct_stream_payload(
-    events: list[dict[str, Any]], *, model: str | None
-) -> dict[str, Any]:
-    response_payload: dict[str, Any] = {}
-    chunks: list[str] = []
-    finish_reason: str | None = None
-    choice_index: int | None = None
-    role = "assistant"
-
-    for event in events:
-        if "id" in event:
-            response_payload["id"] = event.get("id")
-        if "created" in event:
-            response_payload["created"] = event.get("created")
-        if "model" in event:
-            response_payload["model"] = event.get("model")
-        if "system_fingerprint" in event:
-            response_payload["system_fingerprint"] = event.get("system_fingerprint")
-        if isinstance(event.get("usage"), dict):
-            response_payload["usage"] = event.get("usage")
-
-        choices = event.get("choices")
-        if not isinstance(choices, list):
-            continue
-        for choice in choices:
-            if not isinstance(choice, dict):
-                continue
-            if choice_index is None and isinstance(choice.get("index"), int):
-                choice_index = choice.get("index")
-            delta = choice.get("delta")
-            if isinstance(delta, dict):
-                content = delta.get("content")
-                if isinstance(content, str):
-                    chunks.append(content)
-                if isinstance(delta.get("role"), str):
-                    role = delta.get("role")
-            if choice.get("finish_reason") is not None:
-                finish_reason = choice.get("finish_reason")
-
-    payload_model = response_payload.get("model")
-    if not isinstance(payload_model, str) and isinstance(model, str):
-        response_payload["model"] = model
-    response_payload["object"] = "chat.completion"
-    response_payload["choices"] = [
-        {
-            "index": choice_index if isinstance(choice_index, int) else 0,
-            "message": {"role": role, "content": "".join(chunks)},
-            "finish_reason": finish_reason,
-        }
-    ]
-    return response_payload
-
-
 def extract_output_text(payload: dict[str, Any]) -> str:
     choices = payload.get("choices")
     if not isinstance(choices, list):
@@ -271,6 +297,54 @@ def extract_output_text(payload: dict[str, Any]) -> str:
     return ""
 
 
+# Keep-alive connections are held per thread (http.client connections are
+# not safe to share across threads) and keyed by host, so sequential
+# requests skip the TCP + TLS handshake.
+_local = threading.local()
+
+
+def _open_response(
+    base_url: str, data: bytes, headers: dict[str, str], timeout_s: float
+) -> http.client.HTTPResponse:
+    """POST on this thread's keep-alive connection and return the response.
+
+    Retries once after reopening the connection, but only when a reused
+    keep-alive socket died before any response arrived — the server closed
+    it between requests. Fresh connections and timeouts never retry: the
+    request may already be generating (and billing) on the server.
+    """
+    parsed = urllib.parse.urlsplit(base_url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(parsed.netloc)
+    reused = conn is not None
+    if conn is None:
+        conn = http.client.HTTPSConnection(parsed.netloc, timeout=timeout_s)
+        connections[parsed.netloc] = conn
+    else:
+        conn.timeout = timeout_s
+    try:
+        conn.request("POST", path, body=data, headers=headers)
+        return conn.getresponse()
+    except (
+        http.client.RemoteDisconnected,
+        BrokenPipeError,
+        ConnectionResetError,
+    ):
+        conn.close()
+        if not reused:
+            raise
+        conn.request("POST", path, body=data, headers=headers)
+        return conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        raise
+
+
 def send_chat_completion_request(
     payload: dict[str, Any],
     *,
@@ -281,68 +355,101 @@ def send_chat_completion_request(
     stream_text_callback: Callable[[str], None] | None = None,
     sse_event_path: Path | None = None,
 ) -> dict[str, Any]:
-    data = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(
-        base_url,
-        data=data,
-        method="POST",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "llm-philosophy/1.0",
-        },
-    )
+    data = _json.dumps(payload)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "User-Agent": "llm-philosophy/1.0",
+    }
     try:
-        with urllib.request.urlopen(request, timeout=timeout_s) as response:
-            if payload.get("stream") is True:
-                events: list[dict[str, Any]] = []
-                streamed_chars = 0
-                sse_handle = None
-                if sse_event_path is not None:
-                    sse_event_path.parent.mkdir(parents=True, exist_ok=True)
-                    sse_handle = sse_event_path.open("a", encoding="utf-8")
-                try:
-                    for event in _iter_sse_events(response):
-                        events.append(event)
-                        if sse_handle is not None:
-                            sse_handle.write(json.dumps(event, ensure_ascii=True))
-                            sse_handle.write("\n")
-                        choices = event.get("choices")
-                        if not isinstance(choices, list):
-                            continue
-                        for choice in choices:
-                            if not isinstance(choice, dict):
-                                continue
-                            delta = choice.get("delta")
-                            if not isinstance(delta, dict):
-                                continue
-                            text = delta.get("content")
-                            if isinstance(text, str):
-                                streamed_chars += len(text)
-                                if stream_text_callback is not None:
-                                    stream_text_callback(text)
-                                if progress_callback is not None:
-                                    progress_callback(streamed_chars)
-                finally:
-                    if sse_handle is not None:
-                        sse_handle.close()
-                response_payload = _reconstruct_stream_payload(
-                    events,
-                    model=payload.get("model") if isinstance(payload.get("model"), str) else None,
-                )
-                output_text = extract_output_text(response_payload)
-                if progress_callback is not None and output_text:
-                    progress_callback(len(output_text))
-                return response_payload
-            body = response.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"Grok API error {exc.code}: {error_body}") from exc
-    except urllib.error.URLError as exc:
+        response = _open_response(base_url, data, headers, timeout_s)
+    except OSError as exc:
         raise RuntimeError(f"Grok API connection error: {exc}") from exc
-    payload = json.loads(body)
-    return payload
+    if response.status != 200:
+        error_body = response.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"Grok API error {response.status}: {error_body}")
+    if payload.get("stream") is True:
+        content_buf = io.StringIO()
+        streamed_chars = 0
+
+        # Metadata is accumulated in the same pass as the deltas, so no
+        # second walk over the events is needed at stream end.
+        response_payload: dict[str, Any] = {}
+        finish_reason: str | None = None
+        choice_index: int | None = None
+        role = "assistant"
+
+        sse_handle = None
+        if sse_event_path is not None:
+            sse_event_path.parent.mkdir(parents=True, exist_ok=True)
+            sse_handle = sse_event_path.open("ab")
+        try:
+            for event in _iter_sse_events(response):
+                if sse_handle is not None:
+                    sse_handle.write(_json.dumps(event) + b"\n")
+                if (v := event.get("id")) is not None:
+                    response_payload["id"] = v
+                if (v := event.get("created")) is not None:
+                    response_payload["created"] = v
+                if (v := event.get("model")) is not None:
+                    response_payload["model"] = v
+                if (v := event.get("system_fingerprint")) is not None:
+                    response_payload["system_fingerprint"] = v
+                usage = event.get("usage")
+                if type(usage) is dict:
+                    response_payload["usage"] = usage
+                choices = event.get("choices")
+                if type(choices) is not list:
+                    continue
+                for choice in choices:
+                    if type(choice) is not dict:
+                        continue
+                    if choice_index is None:
+                        index = choice.get("index")
+                        if type(index) is int:
+                            choice_index = index
+                    reason = choice.get("finish_reason")
+                    if reason is not None:
+                        finish_reason = reason
+                    delta = choice.get("delta")
+                    if type(delta) is not dict:
+                        continue
+                    delta_role = delta.get("role")
+                    if type(delta_role) is str:
+                        role = delta_role
+                    text = delta.get("content")
+                    if type(text) is str:
+                        content_buf.write(text)
+                        streamed_chars += len(text)
+                        if stream_text_callback is not None:
+                            stream_text_callback(text)
+                        if progress_callback is not None:
+                            progress_callback(streamed_chars)
+        finally:
+            if sse_handle is not None:
+                sse_handle.close()
+        # Drain any trailing bytes so the connection stays reusable.
+        response.read()
+
+        if not isinstance(response_payload.get("model"), str) and isinstance(
+            payload.get("model"), str
+        ):
+            response_payload["model"] = payload["model"]
+        response_payload["object"] = "chat.completion"
+        output_text = content_buf.getvalue()
+        response_payload["choices"] = [
+            {
+                "index": choice_index if choice_index is not None else 0,
+                "message": {"role": role, "content": output_text},
+                "finish_reason": finish_reason,
+            }
+        ]
+        if progress_callback is not None and output_text:
+            progress_callback(len(output_text))
+        return response_payload
+    body = response.read()
+    return _json.loads(body)
 
 
 def create_chat_completion(
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
+import io
 import json
 import os
 from pathlib import Path
 from typing import Any, Callable
 
 from src.costs import CostBreakdown, TokenBreakdown, compute_cost_breakdown
+from src.providers import _json
 
 
 DEFAULT_BASE_URL = "https://api.openai.com/v1"
@@ -91,7 +94,9 @@ def _normalize_base_url(base_url: str) -> str:
     return base_url
 
 
+@functools.lru_cache(maxsize=32)
 def price_schedule_for_model(model: str) -> dict[str, Any] | None:
+    # Memoized: callers treat the returned dict as read-only.
     schedule = PRICE_SCHEDULES_USD_PER_MILLION.get(model)
     if schedule is None:
         return None
@@ -103,10 +108,12 @@ def price_schedule_for_model(model: str) -> dict[str, Any] | None:
     }
 
 
+@functools.lru_cache(maxsize=64)
 def display_model_name(model: str) -> str:
     return MODEL_ALIASES.get(model, model)
 
 
+@functools.lru_cache(maxsize=16)
 def display_provider_name(provider: str) -> str:
     return PROVIDER_ALIASES.get(provider, provider)
 
@@ -128,24 +135,36 @@ def default_reasoning_effort_for_model(model: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def default_reasoning_config_for_model(model: str) -> dict[str, Any] | None:
+    """Return the default reasoning request block, or None for non-reasoning models.
+
+    The returned dict is cached and shared; callers treat it as read-only.
+    """
+    effort = default_reasoning_effort_for_model(model)
+    if effort is None:
+        return None
+    return {"effort": effort, "summary": "detailed"}
+
+
 def supports_model(model: str) -> bool:
     return model in SUPPORTED_MODELS
 
 
 def extract_usage_breakdown(payload: dict[str, Any]) -> TokenBreakdown | None:
     usage = payload.get("usage")
-    if not isinstance(usage, dict):
+    if type(usage) is not dict:
         return None
     input_tokens = usage.get("input_tokens")
     output_tokens = usage.get("output_tokens")
     reasoning_tokens = None
     details = usage.get("output_tokens_details")
-    if isinstance(details, dict):
+    if type(details) is dict:
         reasoning_tokens = details.get("reasoning_tokens")
     return TokenBreakdown(
-        input_tokens=input_tokens if isinstance(input_tokens, int) else None,
-        reasoning_tokens=reasoning_tokens if isinstance(reasoning_tokens, int) else None,
-        output_tokens=output_tokens if isinstance(output_tokens, int) else None,
+        input_tokens=input_tokens if type(input_tokens) is int else None,
+        reasoning_tokens=reasoning_tokens if type(reasoning_tokens) is int else None,
+        output_tokens=output_tokens if type(output_tokens) is int else None,
     )
 
 
@@ -163,6 +182,40 @@ def _content_item(text: str) -> dict[str, str]:
     return {"type": "input_text", "text": text}
 
 
+@functools.lru_cache(maxsize=64)
+def _payload_scaffold(
+    model: str,
+    max_output_tokens: int | None,
+    temperature: float | None,
+    top_p: float | None,
+    seed: int | None,
+    stream: bool | None,
+) -> dict[str, Any]:
+    """Build the input-free payload scaffold for one settings combination.
+
+    Call sites tend to pass the same options every time, so the optional
+    branches run once per combination; the hot path is a cache hit plus a
+    dict copy. Only hashable settings participate — dict/list options are
+    applied per call by build_response_request.
+    """
+    if max_output_tokens is None:
+        max_output_tokens = MODEL_DEFAULTS.get(model, {}).get("max_output_tokens")
+    if max_output_tokens is None:
+        raise ValueError(
+            "max_output_tokens must be set (model defaults are not yet configured)"
+        )
+    payload: dict[str, Any] = {"model": model, "max_output_tokens": max_output_tokens}
+    if temperature is not None:
+        payload["temperature"] = temperature
+    if top_p is not None:
+        payload["top_p"] = top_p
+    if seed is not None:
+        payload["seed"] = seed
+    if stream is not None:
+        payload["stream"] = stream
+    return payload
+
+
 def build_response_request(
     *,
     system_prompt: str,
@@ -179,78 +232,89 @@ def build_response_request(
     stream: bool | None = None,
     stream_options: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    if max_output_tokens is None:
-        defaults = MODEL_DEFAULTS.get(model, {})
-        max_output_tokens = defaults.get("max_output_tokens")
-    if max_output_tokens is None:
-        raise ValueError(
-            "max_output_tokens must be set (model defaults are not yet configured)"
-        )
-
-    payload: dict[str, Any] = {
-        "model": model,
-        "input": [
-            {"role": "system", "content": [_content_item(system_prompt)]},
-            {"role": "user", "content": [_content_item(user_prompt)]},
-        ],
-        "max_output_tokens": max_output_tokens,
-    }
-    if temperature is not None:
-        payload["temperature"] = temperature
-    if top_p is not None:
-        payload["top_p"] = top_p
+    payload = _payload_scaffold(
+        model, max_output_tokens, temperature, top_p, seed, stream
+    ).copy()
+    payload["input"] = [
+        {"role": "system", "content": [_content_item(system_prompt)]},
+        {"role": "user", "content": [_content_item(user_prompt)]},
+    ]
     if reasoning is not None:
         payload["reasoning"] = reasoning
     if tools:
         payload["tools"] = tools
     if tool_choice is not None:
         payload["tool_choice"] = tool_choice
-    if seed is not None:
-        payload["seed"] = seed
     if metadata:
         payload["metadata"] = metadata
-    if stream is not None:
-        payload["stream"] = stream
     if stream_options is not None:
         payload["stream_options"] = stream_options
     return payload
 
 
+# Dumper resolved once per SDK type, so repeat events pay one dict probe
+# instead of the getattr cascade below.
+_DUMP_CACHE: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
+def _resolve_dumper(cls: type) -> Callable[[Any], dict[str, Any]]:
+    if callable(getattr(cls, "model_dump_json", None)):
+        # Pydantic v2's C-accelerated model_dump_json plus a fast parse beats
+        # the Python-level model_dump(mode="json") traversal.
+        def dump(value: Any) -> dict[str, Any]:
+            try:
+                return _json.loads(
+                    value.model_dump_json(exclude_none=True, warnings="none")
+                )
+            except TypeError:
+                return value.model_dump()
+
+        return dump
+    if callable(getattr(cls, "model_dump", None)):
+        def dump(value: Any) -> dict[str, Any]:
+            try:
+                return value.model_dump(mode="json", exclude_none=True, warnings="none")
+            except TypeError:
+                return value.model_dump()
+
+        return dump
+    if callable(getattr(cls, "dict", None)):
+        return lambda value: value.dict()
+    raise TypeError(f"Unsupported OpenAI payload type: {cls!r}")
+
+
 def _model_dump(value: Any) -> dict[str, Any]:
-    if isinstance(value, dict):
+    cls = type(value)
+    if cls is dict:
         return value
-    dump = getattr(value, "model_dump", None)
-    if callable(dump):
-        try:
-            return dump(mode="json", exclude_none=True, warnings="none")
-        except TypeError:
-            return dump()
-    legacy_dump = getattr(value, "dict", None)
-    if callable(legacy_dump):
-        return legacy_dump()
-    raise TypeError(f"Unsupported OpenAI payload type: {type(value)!r}")
+    dumper = _DUMP_CACHE.get(cls)
+    if dumper is None:
+        if isinstance(value, dict):
+            return value
+        dumper = _DUMP_CACHE[cls] = _resolve_dumper(cls)
+    return dumper(value)
 
 
 def _extract_output_text_from_stream(events: list[dict[str, Any]]) -> str:
-    chunks: list[str] = []
+    buf = io.StringIO()
     response_payload: dict[str, Any] | None = None
     for event in events:
         event_type = event.get("type")
         if event_type == "response.output_text.delta":
             delta = event.get("delta")
             if isinstance(delta, str):
-                chunks.append(delta)
+                buf.write(delta)
         elif event_type in {"response.output_text.done", "response.text.done"}:
-            if not chunks:
+            if not buf.tell():
                 text = event.get("text")
                 if isinstance(text, str):
-                    chunks.append(text)
+                    buf.write(text)
         elif event_type == "response.completed":
             response = event.get("response")
             if isinstance(response, dict):
                 response_payload = response
-    if chunks:
-        return "".join(chunks)
+    if buf.tell():
+        return buf.getvalue()
     if response_payload:
         return extract_output_text(response_payload)
     return ""
@@ -259,7 +323,7 @@ def _extract_output_text_from_stream(events: list[dict[str, Any]]) -> str:
 def _coalesce_reasoning_summary_parts(
     *,
     done_order: list[tuple[int | None, str]],
-    delta_chunks: dict[int, list[str]],
+    delta_chunks: dict[int, bytearray],
 ) -> list[str]:
     parts: list[str] = []
     used_indices: set[int] = set()
@@ -271,15 +335,15 @@ def _coalesce_reasoning_summary_parts(
             continue
         if isinstance(index, int):
             deltas = delta_chunks.get(index)
-            if isinstance(deltas, list) and deltas:
-                parts.append("".join(deltas))
+            if deltas:
+                parts.append(bytes(deltas).decode("utf-8", errors="replace"))
                 used_indices.add(index)
     for index in sorted(delta_chunks):
         if index in used_indices:
             continue
         deltas = delta_chunks.get(index)
-        if isinstance(deltas, list) and deltas:
-            parts.append("".join(deltas))
+        if deltas:
+            parts.append(bytes(deltas).decode("utf-8", errors="replace"))
     return parts
 
 
@@ -340,48 +404,59 @@ def send_response_request(
         if payload.get("stream") is True:
             streamed_chars = 0
             response_payload: dict[str, Any] | None = None
-            summary_chunks: dict[int, list[str]] = {}
+            # Deltas accumulate as UTF-8 bytes and are evicted as soon as the
+            # authoritative part text arrives, bounding peak memory on long
+            # reasoning summaries.
+            summary_chunks: dict[int, bytearray] = {}
             summary_done_order: list[tuple[int | None, str]] = []
             sse_handle = None
             if sse_event_path is not None:
                 sse_event_path.parent.mkdir(parents=True, exist_ok=True)
-                sse_handle = sse_event_path.open("a", encoding="utf-8")
+                sse_handle = sse_event_path.open("ab", buffering=1 << 20)
             try:
                 stream = client.responses.create(**payload)
                 for event in stream:
-                    event_payload = _model_dump(event)
+                    # Read the few fields we branch on straight off the SDK
+                    # event object; the full pydantic dump runs only for the
+                    # SSE debug log and the final response payload.
                     if sse_handle is not None:
-                        sse_handle.write(json.dumps(event_payload, ensure_ascii=True))
-                        sse_handle.write("\n")
-                    event_type = event_payload.get("type")
+                        sse_handle.write(_json.dumps(_model_dump(event)) + b"\n")
+                    event_type = getattr(event, "type", None)
                     if event_type == "response.output_text.delta":
-                        delta = event_payload.get("delta")
-                        if isinstance(delta, str):
+                        delta = getattr(event, "delta", None)
+                        if type(delta) is str:
                             streamed_chars += len(delta)
                             if stream_text_callback is not None:
                                 stream_text_callback(delta)
                             if progress_callback is not None:
                                 progress_callback(streamed_chars)
                     elif event_type == "response.reasoning_summary_text.delta":
-                        delta = event_payload.get("delta")
-                        index = event_payload.get("summary_index")
-                        if isinstance(delta, str) and isinstance(index, int):
-                            summary_chunks.setdefault(index, []).append(delta)
+                        delta = getattr(event, "delta", None)
+                        index = getattr(event, "summary_index", None)
+                        if type(delta) is str and type(index) is int:
+                            buf = summary_chunks.get(index)
+                            if buf is None:
+                                buf = summary_chunks[index] = bytearray()
+                            buf += delta.encode("utf-8")
                     elif event_type == "response.reasoning_summary_part.done":
-                        index = event_payload.get("summary_index")
-                        part = event_payload.get("part")
-                        if isinstance(index, int) and isinstance(part, dict):
+                        index = getattr(event, "summary_index", None)
+                        part = getattr(event, "part", None)
+                        if isinstance(part, dict):
                             text = part.get("text")
-                            if isinstance(text, str):
-                                summary_done_order.append((index, text))
-                        elif isinstance(part, dict):
-                            text = part.get("text")
-                            if isinstance(text, str):
-                                summary_done_order.append((None, text))
+                        else:
+                            text = getattr(part, "text", None)
+                        if type(text) is str:
+                            summary_done_order.append(
+                                (index if type(index) is int else None, text)
+                            )
+                            # An empty done text falls back to the
+                            # accumulated deltas, so only evict on content.
+                            if text and type(index) is int:
+                                summary_chunks.pop(index, None)
                     elif event_type in {"response.completed", "response.failed"}:
-                        response = event_payload.get("response")
-                        if isinstance(response, dict):
-                            response_payload = response
+                        response = getattr(event, "response", None)
+                        if response is not None:
+                            response_payload = _model_dump(response)
             finally:
                 if sse_handle is not None:
                     sse_handle.close()
@@ -416,25 +491,16 @@ def extract_output_text(payload: dict[str, Any]) -> str:
 
     outputs = payload.get("output", [])
     if isinstance(outputs, list):
-        chunks: list[str] = []
-        for item in outputs:
-            if not isinstance(item, dict):
-                continue
-            if item.get("type") != "message":
-                continue
-            content = item.get("content", [])
-            if not isinstance(content, list):
-                continue
-            for part in content:
-                if not isinstance(part, dict):
-                    continue
-                if part.get("type") != "output_text":
-                    continue
-                text = part.get("text")
-                if isinstance(text, str):
-                    chunks.append(text)
-        if chunks:
-            return "\n".join(chunks)
+        # Flat generator feeding join directly; exact-type checks suffice
+        # for JSON-decoded payloads.
+        return "\n".join(
+            text
+            for item in outputs
+            if type(item) is dict and item.get("type") == "message"
+            for part in (item.get("content") or ())
+            if type(part) is dict and part.get("type") == "output_text"
+            and type(text := part.get("text")) is str
+        )
     return ""
 
 
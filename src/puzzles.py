@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import ast
 from dataclasses import dataclass
+import functools
 from importlib.machinery import SourceFileLoader
 from importlib.util import module_from_spec, spec_from_loader
+import os
 from pathlib import Path
 from types import ModuleType
 from typing import Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Puzzle:
     name: str
     title: str | None
@@ -20,12 +23,19 @@ class Puzzle:
     path: Path
 
 
+# Resolved once at import; Path.resolve() hits the filesystem.
+_DEFAULT_PUZZLE_DIR = Path(__file__).resolve().parents[1] / "prompts" / "puzzles"
+
+
 def _default_puzzle_dir() -> Path:
-    return Path(__file__).resolve().parents[1] / "prompts" / "puzzles"
+    return _DEFAULT_PUZZLE_DIR
 
 
-def _load_module(path: Path) -> ModuleType:
-    loader = SourceFileLoader(path.stem, str(path))
+@functools.lru_cache(maxsize=128)
+def _load_module_cached(path_str: str, mtime_ns: int) -> ModuleType:
+    # mtime_ns participates in the cache key so an edited file reloads.
+    path = Path(path_str)
+    loader = SourceFileLoader(path.stem, path_str)
     spec = spec_from_loader(path.stem, loader)
     if spec is None:
         raise ImportError(f"Unable to load puzzle module: {path}")
@@ -36,34 +46,98 @@ def _load_module(path: Path) -> ModuleType:
     return module
 
 
-def _coerce_metadata(value: object) -> dict:
+def _load_module(path: Path) -> ModuleType:
+    return _load_module_cached(str(path), path.stat().st_mtime_ns)
+
+
+_PUZZLE_CONSTANT_NAMES = frozenset(
+    {"PUZZLE_NAME", "PUZZLE_TITLE", "PUZZLE_VERSION", "PUZZLE_TEXT", "PUZZLE_METADATA"}
+)
+
+
+def _parse_puzzle_constants(path: Path) -> dict[str, object]:
+    """Extract the module-level puzzle constants without executing the file."""
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    constants: dict[str, object] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            value = node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            # PUZZLE_TEXT: str = "..." executes fine, so parse it too.
+            target = node.target
+            value = node.value
+        else:
+            continue
+        if not isinstance(target, ast.Name) or target.id not in _PUZZLE_CONSTANT_NAMES:
+            continue
+        constants[target.id] = ast.literal_eval(value)
+    return constants
+
+
+@functools.lru_cache(maxsize=128)
+def _load_constants_cached(path_str: str, mtime_ns: int) -> dict[str, object]:
+    path = Path(path_str)
+    try:
+        constants = _parse_puzzle_constants(path)
+    except (SyntaxError, ValueError):
+        constants = None
+    if constants is not None and "PUZZLE_TEXT" in constants:
+        return constants
+    # Puzzle files normally hold only literal assignments; fall back to
+    # executing the module if one computes a value or assigns PUZZLE_TEXT
+    # in a form the parser does not recognize.
+    module = _load_module_cached(path_str, mtime_ns)
+    return {
+        name: getattr(module, name)
+        for name in _PUZZLE_CONSTANT_NAMES
+        if hasattr(module, name)
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _load_puzzle_cached(path_str: str, mtime_ns: int) -> Puzzle:
+    # Shared by load_puzzle and load_all_puzzles so a "list everything,
+    # then load one" workflow validates each file only once.
+    path = Path(path_str)
+    constants = _load_constants_cached(path_str, mtime_ns)
+    return _build_puzzle(constants, path)
+
+
+def _coerce_metadata(value: object, path: Path) -> dict:
     if value is None:
         return {}
-    if isinstance(value, dict):
-        return value
-    raise TypeError("PUZZLE_METADATA must be a dict if provided")
-
-
-def _build_puzzle(module: ModuleType, path: Path) -> Puzzle:
-    if not hasattr(module, "PUZZLE_TEXT"):
+    if not isinstance(value, dict):
+        raise TypeError("PUZZLE_METADATA must be a dict if provided")
+    # Catch malformed metadata at load time instead of deep in the runner.
+    for key in value:
+        if not isinstance(key, str):
+            raise ValueError(
+                f"PUZZLE_METADATA keys must be strings in {path.name}: {key!r}"
+            )
+    return value
+
+
+def _build_puzzle(constants: dict[str, object], path: Path) -> Puzzle:
+    if "PUZZLE_TEXT" not in constants:
         raise ValueError(f"Missing PUZZLE_TEXT in {path.name}")
-    text = getattr(module, "PUZZLE_TEXT")
+    text = constants["PUZZLE_TEXT"]
     if not isinstance(text, str) or not text.strip():
         raise ValueError(f"PUZZLE_TEXT must be a non-empty string in {path.name}")
 
-    name = getattr(module, "PUZZLE_NAME", path.stem)
+    name = constants.get("PUZZLE_NAME", path.stem)
     if not isinstance(name, str) or not name.strip():
         raise ValueError(f"PUZZLE_NAME must be a non-empty string in {path.name}")
 
-    title = getattr(module, "PUZZLE_TITLE", None)
+    title = constants.get("PUZZLE_TITLE")
     if title is not None and not isinstance(title, str):
         raise ValueError(f"PUZZLE_TITLE must be a string in {path.name}")
 
-    version = getattr(module, "PUZZLE_VERSION", None)
+    version = constants.get("PUZZLE_VERSION")
     if version is not None and not isinstance(version, str):
         raise ValueError(f"PUZZLE_VERSION must be a string in {path.name}")
 
-    metadata = _coerce_metadata(getattr(module, "PUZZLE_METADATA", None))
+    metadata = _coerce_metadata(constants.get("PUZZLE_METADATA"), path)
 
     return Puzzle(
         name=name,
@@ -77,13 +151,19 @@ def _build_puzzle(module: ModuleType, path: Path) -> Puzzle:
 
 def list_puzzle_paths(puzzle_dir: Path | None = None) -> list[Path]:
     root = puzzle_dir or _default_puzzle_dir()
-    if not root.exists():
+    # scandir answers is_file from the readdir cache, avoiding the per-entry
+    # stat that iterdir + is_file would issue.
+    try:
+        with os.scandir(root) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("__")
+                and entry.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
         return []
-    return sorted(
-        path
-        for path in root.iterdir()
-        if path.is_file() and path.suffix == ".py" and not path.name.startswith("__")
-    )
 
 
 def list_puzzle_names(puzzle_dir: Path | None = None) -> list[str]:
@@ -93,10 +173,12 @@ def list_puzzle_names(puzzle_dir: Path | None = None) -> list[str]:
 def load_puzzle(name: str, puzzle_dir: Path | None = None) -> Puzzle:
     root = puzzle_dir or _default_puzzle_dir()
     path = root / f"{name}.py"
-    if not path.exists():
-        raise FileNotFoundError(f"Puzzle not found: {name}")
-    module = _load_module(path)
-    puzzle = _build_puzzle(module, path)
+    # One stat covers both the existence check and the cache key.
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as exc:
+        raise FileNotFoundError(f"Puzzle not found: {name}") from exc
+    puzzle = _load_puzzle_cached(str(path), mtime_ns)
     if puzzle.name != name:
         raise ValueError(
             f"Puzzle name mismatch for {name}: module defines {puzzle.name!r}"
@@ -106,5 +188,4 @@ def load_puzzle(name: str, puzzle_dir: Path | None = None) -> Puzzle:
 
 def load_all_puzzles(puzzle_dir: Path | None = None) -> Iterable[Puzzle]:
     for path in list_puzzle_paths(puzzle_dir):
-        module = _load_module(path)
-        yield _build_puzzle(module, path)
+        yield _load_puzzle_cached(str(path), path.stat().st_mtime_ns)
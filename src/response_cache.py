@@ -0,0 +1,94 @@
+"""Exact-match on-disk cache for provider responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def _canonical_dumps(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _canonical_dumps(value: Any) -> bytes:
+        return json.dumps(value, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    _loads = json.loads
+
+
+def _cache_dir(base_dir: Path) -> Path:
+    return base_dir / ".cache"
+
+
+def cache_key(provider: str, model: str, request_payload: dict[str, Any]) -> str:
+    """Hash of the canonical request; identical requests map to one key."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(provider.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(_canonical_dumps(request_payload))
+    return digest.hexdigest()
+
+
+def lookup(
+    base_dir: Path,
+    provider: str,
+    model: str,
+    request_payload: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Return the cached record for an identical earlier request, or None.
+
+    Records hold the raw response payload under "response" and the
+    extracted text under "output_text".
+    """
+    path = _cache_dir(base_dir) / f"{cache_key(provider, model, request_payload)}.json"
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        record = _loads(raw)
+    except ValueError:
+        return None
+    # Treat truncated or older-format records as misses rather than
+    # letting callers hit a KeyError.
+    if type(record) is not dict:
+        return None
+    if type(record.get("response")) is not dict:
+        return None
+    if type(record.get("output_text")) is not str:
+        return None
+    return record
+
+
+def store(
+    base_dir: Path,
+    provider: str,
+    model: str,
+    request_payload: dict[str, Any],
+    response_payload: dict[str, Any],
+    output_text: str,
+) -> None:
+    directory = _cache_dir(base_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    key = cache_key(provider, model, request_payload)
+    record = {
+        "provider": provider,
+        "model": model,
+        "response": response_payload,
+        "output_text": output_text,
+    }
+    # Write-then-rename keeps concurrent runners from reading a partial file.
+    tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+    tmp_path.write_bytes(_canonical_dumps(record))
+    os.replace(tmp_path, directory / f"{key}.json")
@@ -2,87 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import functools
+import io
 from pathlib import Path
+import queue
+import sys
+import threading
+import time
 from typing import Any, Callable
 from uuid import uuid4
 
-from src.providers.openai import (
-    build_response_request,
-    calculate_cost_breakdown as openai_calculate_cost_breakdown,
-    default_reasoning_effort_for_model,
-    display_model_name,
-    display_provider_name,
-    extract_usage_breakdown as openai_extract_usage_breakdown,
-    extract_output_text,
-    extract_reasoning_summary_from_stream,
-    price_schedule_for_model,
-    require_api_key,
-    send_response_request,
-    supports_reasoning as openai_supports_reasoning,
-)
-from src.providers.gemini import (
-    build_generate_content_request,
-    calculate_cost_breakdown as gemini_calculate_cost_breakdown,
-    default_temperature_for_model as gemini_default_temperature_for_model,
-    default_thinking_config_for_model as gemini_default_thinking_config_for_model,
-    display_model_name as display_gemini_model_name,
-    display_provider_name as display_gemini_provider_name,
-    extract_usage_breakdown as gemini_extract_usage_breakdown,
-    price_schedule_for_model as gemini_price_schedule_for_model,
-    require_api_key as require_gemini_api_key,
-    send_generate_content_request,
-    supports_reasoning as gemini_supports_reasoning,
-)
-from src.providers.anthropic import (
-    build_messages_request,
-    calculate_cost_breakdown as anthropic_calculate_cost_breakdown,
-    default_output_config_for_model as anthropic_default_output_config_for_model,
-    default_thinking_config_for_model as anthropic_default_thinking_config_for_model,
-    display_model_name as display_anthropic_model_name,
-    display_provider_name as display_anthropic_provider_name,
-    extract_output_text as extract_anthropic_output_text,
-    extract_usage_breakdown as anthropic_extract_usage_breakdown,
-    price_schedule_for_model as anthropic_price_schedule_for_model,
-    require_api_key as require_anthropic_api_key,
-    send_messages_request,
-    supports_reasoning as anthropic_supports_reasoning,
-)
-from src.providers.grok import (
-    build_chat_completion_request,
-    calculate_cost_breakdown as grok_calculate_cost_breakdown,
-    display_model_name as display_grok_model_name,
-    display_provider_name as display_grok_provider_name,
-    extract_output_text as grok_extract_output_text,
-    extract_usage_breakdown as grok_extract_usage_breakdown,
-    price_schedule_for_model as grok_price_schedule_for_model,
-    require_api_key as require_grok_api_key,
-    send_chat_completion_request,
-    supports_reasoning as grok_supports_reasoning,
-)
-from src.providers.fireworks import (
-    build_chat_completion_request as build_fireworks_chat_completion_request,
-    calculate_cost_breakdown as fireworks_calculate_cost_breakdown,
-    display_model_name as display_fireworks_model_name,
-    display_provider_name as display_fireworks_provider_name,
-    extract_output_text as extract_fireworks_output_text,
-    extract_usage_breakdown as fireworks_extract_usage_breakdown,
-    price_schedule_for_model as fireworks_price_schedule_for_model,
-    provider_for_model as fireworks_provider_for_model,
-    require_api_key as require_fireworks_api_key,
-    resolve_model as resolve_fireworks_model,
-    storage_model_name as fireworks_storage_model_name,
-    send_chat_completion_request as send_fireworks_chat_completion_request,
-    supports_reasoning as fireworks_supports_reasoning,
-)
 from src.costs import CostBreakdown, TokenBreakdown, format_cost_line
 from src.puzzles import Puzzle, load_puzzle
+from src import response_cache
 from src.storage import ResponseStore, format_input_text, normalize_special_settings, utc_now_iso
 from src.system_prompt import SystemPrompt, load_system_prompt
 
+# Prints below rely on line buffering instead of flushing per call; the
+# progress writer thread flushes explicitly since its frames end in "\r".
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=True)
 
-@dataclass(frozen=True)
+# Single storage thread: request records are written here so the disk
+# write overlaps the API call instead of delaying it.
+_STORE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store")
+atexit.register(_STORE_EXECUTOR.shutdown, wait=True)
+
+
+@dataclass(frozen=True, slots=True)
 class RunResult:
     run_id: str
     request_payload: dict[str, Any]
@@ -95,12 +47,54 @@ class RunResult:
     tokens: TokenBreakdown | None = None
 
 
+@functools.lru_cache(maxsize=256)
 def _format_timestamp(created_at: str) -> str:
+    # utc_now_iso() yields "YYYY-MM-DDTHH:MM:SS.ffffff+00:00"; already-UTC
+    # strings just need the colons dropped, no datetime round-trip.
+    if created_at.endswith("+00:00") and len(created_at) >= 19:
+        return f"{created_at[:13]}{created_at[14:16]}{created_at[17:19]}Z"
     timestamp = datetime.fromisoformat(created_at)
     timestamp = timestamp.astimezone(timezone.utc)
     return timestamp.strftime("%Y-%m-%dT%H%M%SZ")
 
 
+# Terminal frames are handed to a daemon writer thread so a slow terminal
+# (e.g. over SSH) can never stall the HTTP read loop. The writer drains the
+# queue and draws only the newest frame.
+_PROGRESS_QUEUE: queue.Queue[str] = queue.Queue()
+_PROGRESS_WRITER_LOCK = threading.Lock()
+_progress_writer_started = False
+
+
+def _drain_progress_queue() -> None:
+    while True:
+        frame = _PROGRESS_QUEUE.get()
+        while True:
+            try:
+                newer = _PROGRESS_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+            _PROGRESS_QUEUE.task_done()
+            frame = newer
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        _PROGRESS_QUEUE.task_done()
+
+
+def _emit_progress(frame: str) -> None:
+    global _progress_writer_started
+    if not _progress_writer_started:
+        with _PROGRESS_WRITER_LOCK:
+            if not _progress_writer_started:
+                threading.Thread(
+                    target=_drain_progress_queue,
+                    name="progress-writer",
+                    daemon=True,
+                ).start()
+                _progress_writer_started = True
+    _PROGRESS_QUEUE.put(frame)
+
+
 def _build_progress_callback(
     max_tokens: int | None,
     *,
@@ -109,41 +103,86 @@ def _build_progress_callback(
     on_first_data: Callable[[], None] | None = None,
 ) -> Callable[[int], None]:
     progress_width = len(str(max_tokens)) if isinstance(max_tokens, int) else 0
-    last_progress = {"chars": 0}
-    first_data_fired = {"value": False}
+    # Rendered parts that never change between deltas.
+    total_str = str(max_tokens).zfill(progress_width)
+    prefix = "\rReceiving output text, ≈ "
+    last_tokens = -1
+    first_data_fired = False
+    last_emit = 0.0
 
     def _progress(chars: int) -> None:
+        nonlocal last_tokens, first_data_fired, last_emit
         # Fire on_first_data callback once when we receive any data
-        if on_first_data and not first_data_fired["value"] and chars > 0:
-            first_data_fired["value"] = True
+        if on_first_data and not first_data_fired and chars > 0:
+            first_data_fired = True
             on_first_data()
 
         if quiet:
             return
         if progress_width <= 0:
             return
-        if chars == last_progress["chars"]:
-            return
-        last_progress["chars"] = chars
         # during streaming, we only have the characters themselves
         # use "1 token per 4 characters" standard estimate
-        capped = str(int(chars / 4)).zfill(progress_width)
-        total = str(max_tokens).zfill(progress_width)
-        print(
-            f"\rReceiving output text, ≈ {capped} / {total} {suffix}",
-            end="",
-            flush=True,
-        )
+        tokens = chars >> 2
+        if tokens == last_tokens:
+            return
+        # Cap the redraw rate: fast streams can deliver far more deltas
+        # than a terminal needs, and each redraw is a write+flush syscall.
+        now = time.monotonic()
+        if now - last_emit < 0.05:
+            return
+        last_emit = now
+        last_tokens = tokens
+        _emit_progress(f"{prefix}{tokens:0{progress_width}d} / {total_str} {suffix}")
 
     return _progress
 
 
+def _coalesce_progress(
+    progress_callback: Callable[[int], None],
+    *,
+    min_chars: int = 1024,
+    min_interval_s: float = 0.1,
+) -> Callable[[int], None]:
+    """Forward a growing char count only when it moved enough or enough time passed.
+
+    Fragmented streams deliver thousands of tiny deltas; without
+    coalescing each one costs a Python call into the progress renderer.
+    The first delta always passes through so on_first_data fires promptly.
+    """
+    last_chars = 0
+    last_at = 0.0
+
+    def _forward(chars: int) -> None:
+        nonlocal last_chars, last_at
+        now = time.monotonic()
+        if chars - last_chars < min_chars and now - last_at < min_interval_s:
+            return
+        last_chars = chars
+        last_at = now
+        progress_callback(chars)
+
+    return _forward
+
+
+# Resolved once at import; Path.resolve() hits the filesystem.
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_DEFAULT_RESPONSES_DIR = _REPO_ROOT / "responses"
+
+
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return _REPO_ROOT
+
+
+@functools.lru_cache(maxsize=8)
+def _get_store(base_dir: Path) -> ResponseStore:
+    # One ResponseStore per responses directory; the store is stateless
+    # beyond base_dir, so batch runs can share it across threads.
+    return ResponseStore(base_dir)
 
 
 def _default_responses_dir() -> Path:
-    return _repo_root() / "responses"
+    return _DEFAULT_RESPONSES_DIR
 
 
 def _format_relative_path(path: Path) -> str:
@@ -168,14 +207,10 @@ def _format_token_line(
     ):
         return None
     input_label = (
-        str(tokens.input_tokens)
-        if isinstance(tokens.input_tokens, int)
-        else "unknown"
+        f"{tokens.input_tokens}" if isinstance(tokens.input_tokens, int) else "unknown"
     )
     output_label = (
-        str(tokens.output_tokens)
-        if isinstance(tokens.output_tokens, int)
-        else "unknown"
+        f"{tokens.output_tokens}" if isinstance(tokens.output_tokens, int) else "unknown"
     )
     if not supports_reasoning:
         line = f"Actual tokens: input={input_label}, output={output_label}"
@@ -188,9 +223,7 @@ def _format_token_line(
         if reasoning_disabled:
             reasoning_label = "0 (disabled)"
         elif isinstance(tokens.reasoning_tokens, int):
-            reasoning_label = str(tokens.reasoning_tokens)
-        elif tokens.reasoning_tokens is None:
-            reasoning_label = "unknown"
+            reasoning_label = f"{tokens.reasoning_tokens}"
         else:
             reasoning_label = "unknown"
         line = (
@@ -221,7 +254,7 @@ def _print_run_summary(
     if not isinstance(response_payload, dict):
         return
     if response_payload.get("error") is None:
-        print("Received complete response with no errors.", flush=True)
+        print("Received complete response with no errors.")
     token_line = (
         _format_token_line(
             tokens,
@@ -234,31 +267,30 @@ def _print_run_summary(
         else None
     )
     if token_line is not None:
-        print(token_line, flush=True)
+        print(token_line)
     if cost is not None:
         if not supports_reasoning:
-            print(format_cost_line(cost, include_reasoning=False), flush=True)
+            print(format_cost_line(cost, include_reasoning=False))
         elif combine_reasoning_output:
             print(
                 format_cost_line(
                     cost,
                     include_reasoning=False,
                     output_label="reasoning+output",
-                ),
-                flush=True,
+                )
             )
         else:
-            print(format_cost_line(cost), flush=True)
+            print(format_cost_line(cost))
     if response_text_path is not None:
         relative_path = _format_relative_path(response_text_path)
-        print(f"View problem completion at {relative_path}", flush=True)
+        print(f"View problem completion at {relative_path}")
 
 
 def _format_special_setting(name: str, value: float | int | str) -> str:
     if isinstance(value, float) and value.is_integer():
-        value_label = str(int(value))
+        value_label = f"{int(value)}"
     else:
-        value_label = str(value)
+        value_label = f"{value}"
     return f"{name}-{value_label}"
 
 
@@ -269,9 +301,9 @@ def _format_setting_display(
     default: float | int | str | None = None,
 ) -> str:
     if isinstance(value, float) and value.is_integer():
-        value_label = str(int(value))
+        value_label = f"{int(value)}"
     else:
-        value_label = str(value)
+        value_label = f"{value}"
     if default is None or value == default:
         return f"'{name}' setting set to {value_label}"
     if isinstance(default, float) and default.is_integer():
@@ -281,6 +313,7 @@ def _format_setting_display(
     return f"'{name}' setting set to {value_label} instead of default {default_label}"
 
 
+@functools.lru_cache(maxsize=128)
 def _gemini_special_settings(
     *,
     explicit: str | None,
@@ -289,12 +322,16 @@ def _gemini_special_settings(
     top_p: float | None,
     top_k: int | None,
 ) -> tuple[str, str | None]:
+    # Batch sweeps vary the puzzle, not the sampling knobs, so the same
+    # argument tuple recurs run after run.
     if explicit is not None and str(explicit).strip():
         return normalize_special_settings(explicit), str(explicit)
     settings: list[str] = []
     settings_display: list[str] = []
     if temperature is not None:
-        default_temp = gemini_default_temperature_for_model(model)
+        from src.providers.gemini import default_temperature_for_model
+
+        default_temp = default_temperature_for_model(model)
         if default_temp is None or temperature != default_temp:
             settings.append(_format_special_setting("temperature", temperature))
             settings_display.append(
@@ -333,69 +370,80 @@ def _load_fixtures(
     return system_prompt, puzzle
 
 
-def run_openai_puzzle(
+@dataclass(frozen=True, slots=True)
+class _ProviderRunSpec:
+    """Resolved per-run provider hooks consumed by _run_puzzle.
+
+    Each public runner builds one of these per call rather than from a
+    static table because most fields (aliases, price schedule, the send
+    closure) depend on the resolved model.
+    """
+
+    provider: str
+    record_model: str
+    sse_prefix: str
+    sse_model: str
+    progress_suffix: str
+    request_notice: str
+    max_tokens: Any
+    derived_model_alias: str
+    record_model_alias: str
+    provider_alias: str
+    price_schedule: dict[str, Any] | None
+    supports_reasoning: bool
+    special_settings_label: str
+    send: Callable[[Callable[[int], None] | None, Path | None], tuple[Any, str]]
+    extract_usage: Callable[[dict[str, Any]], TokenBreakdown | None]
+    calc_cost: Callable[[dict[str, Any]], CostBreakdown | None]
+    extra_notice: str | None = None
+    max_tokens_hint: bool = False
+    reasoning_disabled: bool = False
+    combine_reasoning_from_usage: bool = False
+    special_settings_display: str | None = None
+
+
+def _run_puzzle(
+    spec: _ProviderRunSpec,
     *,
-    puzzle_name: str,
-    model: str = "o3-2025-04-16",
-    max_output_tokens: int | None = None,
-    temperature: float | None = None,
-    reasoning: dict[str, Any] | None = None,
-    seed: int | None = None,
-    stream: bool = True,
-    special_settings: str | None = None,
-    dry_run: bool = False,
-    debug_sse: bool = False,
-    debug_sse_path: Path | None = None,
-    run_id: str | None = None,
-    puzzle_dir: Path | None = None,
-    system_path: Path | None = None,
-    responses_dir: Path | None = None,
-    api_key: str | None = None,
-    quiet: bool = False,
-    on_first_data: Callable[[], None] | None = None,
+    system_prompt: SystemPrompt,
+    puzzle: Puzzle,
+    request_payload: dict[str, Any],
+    stream: bool,
+    dry_run: bool,
+    use_cache: bool,
+    debug_sse: bool,
+    debug_sse_path: Path | None,
+    run_id: str | None,
+    responses_dir: Path | None,
+    quiet: bool,
+    on_first_data: Callable[[], None] | None,
 ) -> RunResult:
-    system_prompt, puzzle = _load_fixtures(
-        puzzle_name,
-        puzzle_dir,
-        system_path,
-        model=model,
-        max_output_tokens=max_output_tokens,
-    )
-    created_at = utc_now_iso()
-    run_id = run_id or uuid4().hex
-    provider = "openai"
-    special_settings_label = normalize_special_settings(special_settings)
-    if reasoning is None:
-        effort = default_reasoning_effort_for_model(model)
-        if effort is not None:
-            reasoning = {"effort": effort, "summary": "detailed"}
+    """Shared request/record/report body behind the run_*_puzzle functions.
 
+    Everything provider-specific arrives through the spec; this function
+    owns storage, caching, timing, progress display, and result assembly.
+    """
     if debug_sse and not stream:
         raise ValueError("debug_sse requires stream=True")
 
-    request_payload = build_response_request(
-        system_prompt=system_prompt.text,
-        user_prompt=puzzle.text,
-        model=model,
-        max_output_tokens=max_output_tokens,
-        temperature=temperature,
-        reasoning=reasoning,
-        seed=seed,
-        stream=stream,
-    )
+    created_at = utc_now_iso()
+    run_id = run_id or uuid4().hex
 
     store: ResponseStore | None = None
-    request_path: Path | None = None
+    request_future: Future[Path] | None = None
     if not debug_sse:
-        store = ResponseStore(responses_dir or _default_responses_dir())
-        request_path = store.record_request(
+        store = _get_store(responses_dir or _default_responses_dir())
+        # Written on the storage thread so the disk write overlaps the
+        # upcoming API call; the path is collected before returning.
+        request_future = _STORE_EXECUTOR.submit(
+            store.record_request,
             run_id=run_id,
             created_at=created_at,
-            provider=provider,
-            model=model,
+            provider=spec.provider,
+            model=spec.record_model,
             puzzle_name=puzzle.name,
             puzzle_version=puzzle.version,
-            special_settings=special_settings_label,
+            special_settings=spec.special_settings_label,
             request_payload=request_payload,
         )
 
@@ -405,29 +453,35 @@ def run_openai_puzzle(
             request_payload=request_payload,
             response_payload=None,
             output_text="",
-            request_path=request_path,
+            request_path=request_future.result() if request_future else None,
             response_text_path=None,
             sse_event_path=None,
         )
 
+    cached = (
+        response_cache.lookup(
+            store.base_dir, spec.provider, spec.record_model, request_payload
+        )
+        if use_cache and store is not None
+        else None
+    )
+
     request_started_at = created_at
+    t_start_ns = time.monotonic_ns()
+    max_tokens = spec.max_tokens
     if not quiet:
-        print(
-            f"requesting puzzle={puzzle.name} model={model}",
-            flush=True,
-        )
-    max_tokens = request_payload.get("max_output_tokens")
-    if not quiet and stream and max_tokens is None:
-        print("Set max tokens to see streaming info.", flush=True)
+        print(spec.request_notice)
+        if spec.extra_notice:
+            print(spec.extra_notice)
+        if spec.max_tokens_hint and stream and max_tokens is None:
+            print("Set max tokens to see streaming info.")
     progress_callback = _build_progress_callback(
-        max_tokens, suffix="tokens", quiet=quiet, on_first_data=on_first_data
+        max_tokens if isinstance(max_tokens, int) else None,
+        suffix=spec.progress_suffix,
+        quiet=quiet,
+        on_first_data=on_first_data,
     )
 
-    streamed_chunks: list[str] = []
-
-    def _collect_delta(delta: str) -> None:
-        streamed_chunks.append(delta)
-
     sse_event_path = None
     if debug_sse:
         if debug_sse_path is not None:
@@ -436,87 +490,71 @@ def run_openai_puzzle(
             base_dir = _repo_root() / "tmp"
             timestamp = _format_timestamp(created_at)
             sse_event_path = (
-                base_dir / f"openai-sse-{model}-{run_id}-{timestamp}.jsonl"
+                base_dir
+                / f"{spec.sse_prefix}-sse-{spec.sse_model}-{run_id}-{timestamp}.jsonl"
             )
         if not quiet:
             print(f"DEBUG MODE: skips responses; writing SSE events to {sse_event_path}")
 
-    stream_capture: dict[str, Any] | None = {} if stream else None
-    response_payload = send_response_request(
-        request_payload,
-        api_key=api_key or require_api_key(),
-        progress_callback=progress_callback if stream else None,
-        stream_text_callback=_collect_delta if stream else None,
-        sse_event_path=sse_event_path,
-        stream_capture=stream_capture,
-    )
-    reasoning_summary = extract_reasoning_summary_from_stream(stream_capture)
-    if isinstance(reasoning_summary, str) and reasoning_summary:
-        outputs = (
-            response_payload.get("output")
-            if isinstance(response_payload, dict)
-            else None
+    if cached is not None:
+        response_payload = cached["response"]
+        output_text = cached["output_text"]
+    else:
+        response_payload, output_text = spec.send(
+            progress_callback if stream else None, sse_event_path
         )
-        if isinstance(outputs, list):
-            for item in outputs:
-                if not isinstance(item, dict):
-                    continue
-                if item.get("type") != "reasoning":
-                    continue
-                existing_summary = item.get("summary")
-                if existing_summary:
-                    break
-                item["summary"] = [
-                    {"type": "summary_text", "text": reasoning_summary}
-                ]
-                break
     if not quiet and stream and isinstance(max_tokens, int):
-        print("", flush=True)
+        # Let the writer thread finish the in-flight frame before ending
+        # the progress line.
+        _PROGRESS_QUEUE.join()
+        print("")
+    t_end_ns = time.monotonic_ns()
+    request_path = request_future.result() if request_future is not None else None
     request_completed_at = utc_now_iso()
-    output_text = extract_output_text(response_payload)
-    if stream and streamed_chunks and not output_text:
-        output_text = "".join(streamed_chunks)
+    if use_cache and cached is None and store is not None:
+        response_cache.store(
+            store.base_dir, spec.provider, spec.record_model, request_payload,
+            response_payload, output_text,
+        )
+    payload_dict: dict[str, Any] | None = (
+        response_payload if isinstance(response_payload, dict) else None
+    )
     usage_breakdown = (
-        openai_extract_usage_breakdown(response_payload)
-        if isinstance(response_payload, dict)
-        else None
+        spec.extract_usage(payload_dict) if payload_dict is not None else None
     )
-    cost_breakdown = (
-        openai_calculate_cost_breakdown(response_payload, model=model)
-        if isinstance(response_payload, dict)
-        else None
+    cost_breakdown = spec.calc_cost(payload_dict) if payload_dict is not None else None
+    combine_reasoning_output = (
+        spec.combine_reasoning_from_usage
+        and usage_breakdown is not None
+        and spec.supports_reasoning
+        and usage_breakdown.reasoning_tokens is None
     )
-    supports_reasoning = openai_supports_reasoning(model)
-    reasoning_disabled = False
-    if supports_reasoning and isinstance(reasoning, dict):
-        effort = reasoning.get("effort")
-        if isinstance(effort, str) and effort.lower() in {"none", "off", "disabled"}:
-            reasoning_disabled = True
     input_text = format_input_text(system_prompt.text, puzzle.text)
     derived: dict[str, Any] = {
         "timing": {
             "request_started_at": request_started_at,
             "request_completed_at": request_completed_at,
+            "duration_ms": (t_end_ns - t_start_ns) // 1_000_000,
         }
     }
-    price_schedule = price_schedule_for_model(model)
-    if price_schedule is not None:
-        derived["price_schedule"] = price_schedule
-    derived["model_alias"] = display_model_name(model)
+    if spec.price_schedule is not None:
+        derived["price_schedule"] = spec.price_schedule
+    derived["model_alias"] = spec.derived_model_alias
     stored_text = None
     if store is not None:
         stored_text = store.record_response(
             run_id=run_id,
             created_at=created_at,
-            provider=provider,
-            model=model,
-            model_alias=display_model_name(model),
-            provider_alias=display_provider_name(provider),
+            provider=spec.provider,
+            model=spec.record_model,
+            model_alias=spec.record_model_alias,
+            provider_alias=spec.provider_alias,
             puzzle_name=puzzle.name,
             puzzle_title_prefix="Philosophy problem",
             puzzle_version=puzzle.version,
             puzzle_title=puzzle.title,
-            special_settings=special_settings_label,
+            special_settings=spec.special_settings_label,
+            special_settings_display=spec.special_settings_display,
             request_payload=request_payload,
             response_payload=response_payload,
             input_text=input_text,
@@ -524,13 +562,14 @@ def run_openai_puzzle(
             derived=derived,
         )
     _print_run_summary(
-        response_payload=response_payload if isinstance(response_payload, dict) else None,
+        response_payload=payload_dict,
         tokens=usage_breakdown,
         cost=cost_breakdown,
         max_output_tokens=max_tokens if isinstance(max_tokens, int) else None,
         response_text_path=stored_text.path if stored_text else None,
-        supports_reasoning=supports_reasoning,
-        reasoning_disabled=reasoning_disabled,
+        supports_reasoning=spec.supports_reasoning,
+        reasoning_disabled=spec.reasoning_disabled,
+        combine_reasoning_output=combine_reasoning_output,
         quiet=quiet,
     )
     return RunResult(
@@ -546,17 +585,18 @@ def run_openai_puzzle(
     )
 
 
-def run_fireworks_puzzle(
+def run_openai_puzzle(
     *,
     puzzle_name: str,
-    model: str = "deepseek-v3p2",
+    model: str = "o3-2025-04-16",
     max_output_tokens: int | None = None,
     temperature: float | None = None,
-    top_p: float | None = None,
-    reasoning_effort: str | None = None,
+    reasoning: dict[str, Any] | None = None,
+    seed: int | None = None,
     stream: bool = True,
     special_settings: str | None = None,
     dry_run: bool = False,
+    use_cache: bool = False,
     debug_sse: bool = False,
     debug_sse_path: Path | None = None,
     run_id: str | None = None,
@@ -567,6 +607,23 @@ def run_fireworks_puzzle(
     quiet: bool = False,
     on_first_data: Callable[[], None] | None = None,
 ) -> RunResult:
+    # Imported on first use so importing src.runner does not pull in
+    # every provider adapter.
+    from src.providers.openai import (
+        build_response_request,
+        calculate_cost_breakdown,
+        default_reasoning_config_for_model,
+        display_model_name,
+        display_provider_name,
+        extract_usage_breakdown,
+        extract_output_text,
+        extract_reasoning_summary_from_stream,
+        price_schedule_for_model,
+        require_api_key,
+        send_response_request,
+        supports_reasoning as openai_supports_reasoning,
+    )
+
     system_prompt, puzzle = _load_fixtures(
         puzzle_name,
         puzzle_dir,
@@ -574,180 +631,119 @@ def run_fireworks_puzzle(
         model=model,
         max_output_tokens=max_output_tokens,
     )
-    created_at = utc_now_iso()
-    run_id = run_id or uuid4().hex
-    model_id = resolve_fireworks_model(model)
-    storage_model = fireworks_storage_model_name(model_id)
-    provider = fireworks_provider_for_model(model_id)
     special_settings_label = normalize_special_settings(special_settings)
+    if reasoning is None:
+        reasoning = default_reasoning_config_for_model(model)
 
-    if debug_sse and not stream:
-        raise ValueError("debug_sse requires stream=True")
-
-    request_payload = build_fireworks_chat_completion_request(
+    request_payload = build_response_request(
         system_prompt=system_prompt.text,
         user_prompt=puzzle.text,
-        model=model_id,
+        model=model,
         max_output_tokens=max_output_tokens,
         temperature=temperature,
-        top_p=top_p,
-        reasoning_effort=reasoning_effort,
+        reasoning=reasoning,
+        seed=seed,
         stream=stream,
     )
 
-    store: ResponseStore | None = None
-    request_path: Path | None = None
-    if not debug_sse:
-        store = ResponseStore(responses_dir or _default_responses_dir())
-        request_path = store.record_request(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=storage_model,
-            puzzle_name=puzzle.name,
-            puzzle_version=puzzle.version,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-        )
-
-    if dry_run:
-        return RunResult(
-            run_id=run_id,
-            request_payload=request_payload,
-            response_payload=None,
-            output_text="",
-            request_path=request_path,
-            response_text_path=None,
-            sse_event_path=None,
-        )
-
-    request_started_at = created_at
-    if not quiet:
-        print(
-            f"requesting puzzle={puzzle.name} model={model_id}",
-            flush=True,
+    def _send(
+        progress_callback: Callable[[int], None] | None,
+        sse_event_path: Path | None,
+    ) -> tuple[Any, str]:
+        streamed_text = io.StringIO()
+        stream_capture: dict[str, Any] | None = {} if stream else None
+        response_payload = send_response_request(
+            request_payload,
+            api_key=api_key or require_api_key(),
+            progress_callback=progress_callback,
+            stream_text_callback=streamed_text.write if stream else None,
+            sse_event_path=sse_event_path,
+            stream_capture=stream_capture,
         )
-    max_tokens = request_payload.get("max_tokens")
-    if not quiet and stream and max_tokens is None:
-        print("Set max tokens to see streaming info.", flush=True)
-    progress_callback = _build_progress_callback(
-        max_tokens, suffix="chars", quiet=quiet, on_first_data=on_first_data
-    )
-
-    streamed_chunks: list[str] = []
-
-    def _collect_delta(delta: str) -> None:
-        streamed_chunks.append(delta)
-
-    sse_event_path = None
-    if debug_sse:
-        if debug_sse_path is not None:
-            sse_event_path = debug_sse_path
-        else:
-            base_dir = _repo_root() / "tmp"
-            timestamp = _format_timestamp(created_at)
-            sse_event_path = (
-                base_dir / f"fireworks-sse-{storage_model}-{run_id}-{timestamp}.jsonl"
+        # The Responses API omits reasoning summaries from the final payload
+        # when streaming; patch the streamed summary back in.
+        reasoning_summary = extract_reasoning_summary_from_stream(stream_capture)
+        if reasoning_summary:
+            outputs = (
+                response_payload.get("output")
+                if isinstance(response_payload, dict)
+                else None
             )
-        if not quiet:
-            print(f"DEBUG MODE: skips responses; writing SSE events to {sse_event_path}")
-
-    stream_capture: dict[str, Any] | None = {} if stream else None
-    response_payload = send_fireworks_chat_completion_request(
-        request_payload,
-        api_key=api_key or require_fireworks_api_key(),
-        progress_callback=progress_callback if stream else None,
-        stream_text_callback=_collect_delta if stream else None,
-        sse_event_path=sse_event_path,
-        stream_capture=stream_capture,
-    )
-    if not quiet and stream and isinstance(max_tokens, int):
-        print("", flush=True)
-    request_completed_at = utc_now_iso()
-    output_text = extract_fireworks_output_text(response_payload)
-    if stream and streamed_chunks and not output_text:
-        output_text = "".join(streamed_chunks)
-    usage_breakdown = (
-        fireworks_extract_usage_breakdown(response_payload)
-        if isinstance(response_payload, dict)
-        else None
-    )
-    cost_breakdown = (
-        fireworks_calculate_cost_breakdown(response_payload, model=model_id)
-        if isinstance(response_payload, dict)
-        else None
-    )
-    supports_reasoning = fireworks_supports_reasoning(model_id)
-    reasoning_disabled = (
-        supports_reasoning
-        and isinstance(reasoning_effort, str)
-        and reasoning_effort.lower() in {"none", "off", "disabled"}
-    )
-    input_text = format_input_text(system_prompt.text, puzzle.text)
-    derived: dict[str, Any] = {
-        "timing": {
-            "request_started_at": request_started_at,
-            "request_completed_at": request_completed_at,
-        }
-    }
-    price_schedule = fireworks_price_schedule_for_model(model_id)
-    if price_schedule is not None:
-        derived["price_schedule"] = price_schedule
-    derived["model_alias"] = display_fireworks_model_name(model_id)
-    stored_text = None
-    if store is not None:
-        stored_text = store.record_response(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=storage_model,
-            model_alias=display_fireworks_model_name(storage_model),
-            provider_alias=display_fireworks_provider_name(provider),
-            puzzle_name=puzzle.name,
-            puzzle_title_prefix="Philosophy problem",
-            puzzle_version=puzzle.version,
-            puzzle_title=puzzle.title,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-            response_payload=response_payload,
-            input_text=input_text,
-            output_text=output_text,
-            derived=derived,
-        )
+            if isinstance(outputs, list):
+                item = next(
+                    (
+                        entry
+                        for entry in outputs
+                        if isinstance(entry, dict)
+                        and entry.get("type") == "reasoning"
+                    ),
+                    None,
+                )
+                if item is not None and not item.get("summary"):
+                    item["summary"] = [
+                        {"type": "summary_text", "text": reasoning_summary}
+                    ]
+        output_text = extract_output_text(response_payload)
+        if stream and not output_text and streamed_text.tell():
+            output_text = streamed_text.getvalue()
+        return response_payload, output_text
 
-    _print_run_summary(
-        response_payload=response_payload if isinstance(response_payload, dict) else None,
-        tokens=usage_breakdown,
-        cost=cost_breakdown,
-        max_output_tokens=max_tokens if isinstance(max_tokens, int) else None,
-        response_text_path=stored_text.path if stored_text else None,
+    supports_reasoning = openai_supports_reasoning(model)
+    reasoning_disabled = False
+    if supports_reasoning and isinstance(reasoning, dict):
+        effort = reasoning.get("effort")
+        if isinstance(effort, str) and effort.lower() in {"none", "off", "disabled"}:
+            reasoning_disabled = True
+    model_alias = display_model_name(model)
+    spec = _ProviderRunSpec(
+        provider="openai",
+        record_model=model,
+        sse_prefix="openai",
+        sse_model=model,
+        progress_suffix="tokens",
+        request_notice=f"requesting puzzle={puzzle.name} model={model}",
+        max_tokens=request_payload.get("max_output_tokens"),
+        derived_model_alias=model_alias,
+        record_model_alias=model_alias,
+        provider_alias=display_provider_name("openai"),
+        price_schedule=price_schedule_for_model(model),
         supports_reasoning=supports_reasoning,
+        special_settings_label=special_settings_label,
+        send=_send,
+        extract_usage=extract_usage_breakdown,
+        calc_cost=functools.partial(calculate_cost_breakdown, model=model),
+        max_tokens_hint=True,
         reasoning_disabled=reasoning_disabled,
-        quiet=quiet,
     )
-    return RunResult(
-        run_id=run_id,
+    return _run_puzzle(
+        spec,
+        system_prompt=system_prompt,
+        puzzle=puzzle,
         request_payload=request_payload,
-        response_payload=response_payload,
-        output_text=output_text,
-        request_path=request_path,
-        response_text_path=stored_text.path if stored_text else None,
-        sse_event_path=sse_event_path,
-        cost=cost_breakdown,
-        tokens=usage_breakdown,
+        stream=stream,
+        dry_run=dry_run,
+        use_cache=use_cache,
+        debug_sse=debug_sse,
+        debug_sse_path=debug_sse_path,
+        run_id=run_id,
+        responses_dir=responses_dir,
+        quiet=quiet,
+        on_first_data=on_first_data,
     )
 
 
-def run_grok_puzzle(
+def run_fireworks_puzzle(
     *,
     puzzle_name: str,
-    model: str = "grok-4-1-fast-reasoning",
+    model: str = "deepseek-v3p2",
     max_output_tokens: int | None = None,
     temperature: float | None = None,
     top_p: float | None = None,
-    stream: bool = False,
+    reasoning_effort: str | None = None,
+    stream: bool = True,
     special_settings: str | None = None,
     dry_run: bool = False,
+    use_cache: bool = False,
     debug_sse: bool = False,
     debug_sse_path: Path | None = None,
     run_id: str | None = None,
@@ -758,6 +754,24 @@ def run_grok_puzzle(
     quiet: bool = False,
     on_first_data: Callable[[], None] | None = None,
 ) -> RunResult:
+    # Imported on first use so importing src.runner does not pull in
+    # every provider adapter.
+    from src.providers.fireworks import (
+        build_chat_completion_request,
+        calculate_cost_breakdown,
+        display_model_name,
+        display_provider_name,
+        extract_output_text,
+        extract_usage_breakdown,
+        price_schedule_for_model,
+        provider_for_model,
+        require_api_key,
+        resolve_model,
+        storage_model_name,
+        send_chat_completion_request,
+        supports_reasoning as fireworks_supports_reasoning,
+    )
+
     system_prompt, puzzle = _load_fixtures(
         puzzle_name,
         puzzle_dir,
@@ -765,163 +779,194 @@ def run_grok_puzzle(
         model=model,
         max_output_tokens=max_output_tokens,
     )
-    created_at = utc_now_iso()
-    run_id = run_id or uuid4().hex
-    provider = "grok"
+    model_id = resolve_model(model)
+    storage_model = storage_model_name(model_id)
+    provider = provider_for_model(model_id)
     special_settings_label = normalize_special_settings(special_settings)
 
-    if debug_sse and not stream:
-        raise ValueError("debug_sse requires stream=True")
-
     request_payload = build_chat_completion_request(
         system_prompt=system_prompt.text,
         user_prompt=puzzle.text,
-        model=model,
+        model=model_id,
         max_output_tokens=max_output_tokens,
         temperature=temperature,
         top_p=top_p,
+        reasoning_effort=reasoning_effort,
         stream=stream,
     )
 
-    store: ResponseStore | None = None
-    request_path: Path | None = None
-    if not debug_sse:
-        store = ResponseStore(responses_dir or _default_responses_dir())
-        request_path = store.record_request(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            puzzle_name=puzzle.name,
-            puzzle_version=puzzle.version,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-        )
-
-    if dry_run:
-        return RunResult(
-            run_id=run_id,
-            request_payload=request_payload,
-            response_payload=None,
-            output_text="",
-            request_path=request_path,
-            response_text_path=None,
-            sse_event_path=None,
+    def _send(
+        progress_callback: Callable[[int], None] | None,
+        sse_event_path: Path | None,
+    ) -> tuple[Any, str]:
+        streamed_text = io.StringIO()
+        response_payload = send_chat_completion_request(
+            request_payload,
+            api_key=api_key or require_api_key(),
+            progress_callback=progress_callback,
+            stream_text_callback=streamed_text.write if stream else None,
+            sse_event_path=sse_event_path,
         )
+        output_text = extract_output_text(response_payload)
+        if stream and not output_text and streamed_text.tell():
+            output_text = streamed_text.getvalue()
+        return response_payload, output_text
 
-    request_started_at = created_at
-    if not quiet:
-        print(
-            f"requesting puzzle={puzzle.name} model={model}",
-            flush=True,
-        )
-        if not stream:
-            print(
-                "Streaming turned off for Grok, in order to retain usage stats. "
-                "If connections drop, turn on with --streaming true.",
-                flush=True,
-            )
-    max_tokens = request_payload.get("max_tokens")
-    if not quiet and stream and max_tokens is None:
-        print("Set max tokens to see streaming info.", flush=True)
-    progress_callback = _build_progress_callback(
-        max_tokens, suffix="tokens", quiet=quiet, on_first_data=on_first_data
+    supports_reasoning = fireworks_supports_reasoning(model_id)
+    reasoning_disabled = (
+        supports_reasoning
+        and isinstance(reasoning_effort, str)
+        and reasoning_effort.lower() in {"none", "off", "disabled"}
+    )
+    spec = _ProviderRunSpec(
+        provider=provider,
+        record_model=storage_model,
+        sse_prefix="fireworks",
+        sse_model=storage_model,
+        progress_suffix="chars",
+        request_notice=f"requesting puzzle={puzzle.name} model={model_id}",
+        max_tokens=request_payload.get("max_tokens"),
+        derived_model_alias=display_model_name(model_id),
+        record_model_alias=display_model_name(storage_model),
+        provider_alias=display_provider_name(provider),
+        price_schedule=price_schedule_for_model(model_id),
+        supports_reasoning=supports_reasoning,
+        special_settings_label=special_settings_label,
+        send=_send,
+        extract_usage=extract_usage_breakdown,
+        calc_cost=functools.partial(calculate_cost_breakdown, model=model_id),
+        max_tokens_hint=True,
+        reasoning_disabled=reasoning_disabled,
+    )
+    return _run_puzzle(
+        spec,
+        system_prompt=system_prompt,
+        puzzle=puzzle,
+        request_payload=request_payload,
+        stream=stream,
+        dry_run=dry_run,
+        use_cache=use_cache,
+        debug_sse=debug_sse,
+        debug_sse_path=debug_sse_path,
+        run_id=run_id,
+        responses_dir=responses_dir,
+        quiet=quiet,
+        on_first_data=on_first_data,
     )
 
-    streamed_chunks: list[str] = []
-
-    def _collect_delta(delta: str) -> None:
-        streamed_chunks.append(delta)
-
-    sse_event_path = None
-    if debug_sse:
-        if debug_sse_path is not None:
-            sse_event_path = debug_sse_path
-        else:
-            base_dir = _repo_root() / "tmp"
-            timestamp = _format_timestamp(created_at)
-            sse_event_path = (
-                base_dir / f"grok-sse-{model}-{run_id}-{timestamp}.jsonl"
-            )
-        if not quiet:
-            print(f"DEBUG MODE: skips responses; writing SSE events to {sse_event_path}")
 
-    response_payload = send_chat_completion_request(
-        request_payload,
-        api_key=api_key or require_grok_api_key(),
-        progress_callback=progress_callback if stream else None,
-        stream_text_callback=_collect_delta if stream else None,
-        sse_event_path=sse_event_path,
+def run_grok_puzzle(
+    *,
+    puzzle_name: str,
+    model: str = "grok-4-1-fast-reasoning",
+    max_output_tokens: int | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    stream: bool = False,
+    special_settings: str | None = None,
+    dry_run: bool = False,
+    use_cache: bool = False,
+    debug_sse: bool = False,
+    debug_sse_path: Path | None = None,
+    run_id: str | None = None,
+    puzzle_dir: Path | None = None,
+    system_path: Path | None = None,
+    responses_dir: Path | None = None,
+    api_key: str | None = None,
+    quiet: bool = False,
+    on_first_data: Callable[[], None] | None = None,
+) -> RunResult:
+    # Imported on first use so importing src.runner does not pull in
+    # every provider adapter.
+    from src.providers.grok import (
+        build_chat_completion_request,
+        calculate_cost_breakdown,
+        display_model_name,
+        display_provider_name,
+        extract_output_text,
+        extract_usage_breakdown,
+        price_schedule_for_model,
+        require_api_key,
+        send_chat_completion_request,
+        supports_reasoning as grok_supports_reasoning,
     )
-    if not quiet and stream and isinstance(max_tokens, int):
-        print("", flush=True)
-    request_completed_at = utc_now_iso()
-    output_text = grok_extract_output_text(response_payload)
-    if stream and streamed_chunks and not output_text:
-        output_text = "".join(streamed_chunks)
-    usage_breakdown = (
-        grok_extract_usage_breakdown(response_payload)
-        if isinstance(response_payload, dict)
-        else None
+
+    system_prompt, puzzle = _load_fixtures(
+        puzzle_name,
+        puzzle_dir,
+        system_path,
+        model=model,
+        max_output_tokens=max_output_tokens,
     )
-    cost_breakdown = (
-        grok_calculate_cost_breakdown(response_payload, model=model)
-        if isinstance(response_payload, dict)
-        else None
+    special_settings_label = normalize_special_settings(special_settings)
+
+    request_payload = build_chat_completion_request(
+        system_prompt=system_prompt.text,
+        user_prompt=puzzle.text,
+        model=model,
+        max_output_tokens=max_output_tokens,
+        temperature=temperature,
+        top_p=top_p,
+        stream=stream,
     )
-    supports_reasoning = grok_supports_reasoning(model)
-    reasoning_disabled = False
-    input_text = format_input_text(system_prompt.text, puzzle.text)
-    derived: dict[str, Any] = {
-        "timing": {
-            "request_started_at": request_started_at,
-            "request_completed_at": request_completed_at,
-        }
-    }
-    price_schedule = grok_price_schedule_for_model(model)
-    if price_schedule is not None:
-        derived["price_schedule"] = price_schedule
-    derived["model_alias"] = display_grok_model_name(model)
-    stored_text = None
-    if store is not None:
-        stored_text = store.record_response(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            model_alias=display_grok_model_name(model),
-            provider_alias=display_grok_provider_name(provider),
-            puzzle_name=puzzle.name,
-            puzzle_title_prefix="Philosophy problem",
-            puzzle_version=puzzle.version,
-            puzzle_title=puzzle.title,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-            response_payload=response_payload,
-            input_text=input_text,
-            output_text=output_text,
-            derived=derived,
+
+    def _send(
+        progress_callback: Callable[[int], None] | None,
+        sse_event_path: Path | None,
+    ) -> tuple[Any, str]:
+        streamed_text = io.StringIO()
+        response_payload = send_chat_completion_request(
+            request_payload,
+            api_key=api_key or require_api_key(),
+            progress_callback=progress_callback,
+            stream_text_callback=streamed_text.write if stream else None,
+            sse_event_path=sse_event_path,
         )
-    _print_run_summary(
-        response_payload=response_payload if isinstance(response_payload, dict) else None,
-        tokens=usage_breakdown,
-        cost=cost_breakdown,
-        max_output_tokens=max_tokens if isinstance(max_tokens, int) else None,
-        response_text_path=stored_text.path if stored_text else None,
-        supports_reasoning=supports_reasoning,
-        reasoning_disabled=reasoning_disabled,
-        quiet=quiet,
+        output_text = extract_output_text(response_payload)
+        if stream and not output_text and streamed_text.tell():
+            output_text = streamed_text.getvalue()
+        return response_payload, output_text
+
+    model_alias = display_model_name(model)
+    spec = _ProviderRunSpec(
+        provider="grok",
+        record_model=model,
+        sse_prefix="grok",
+        sse_model=model,
+        progress_suffix="tokens",
+        request_notice=f"requesting puzzle={puzzle.name} model={model}",
+        max_tokens=request_payload.get("max_tokens"),
+        derived_model_alias=model_alias,
+        record_model_alias=model_alias,
+        provider_alias=display_provider_name("grok"),
+        price_schedule=price_schedule_for_model(model),
+        supports_reasoning=grok_supports_reasoning(model),
+        special_settings_label=special_settings_label,
+        send=_send,
+        extract_usage=extract_usage_breakdown,
+        calc_cost=functools.partial(calculate_cost_breakdown, model=model),
+        extra_notice=(
+            None
+            if stream
+            else "Streaming turned off for Grok, in order to retain usage stats. "
+            "If connections drop, turn on with --streaming true."
+        ),
+        max_tokens_hint=True,
     )
-    return RunResult(
-        run_id=run_id,
+    return _run_puzzle(
+        spec,
+        system_prompt=system_prompt,
+        puzzle=puzzle,
         request_payload=request_payload,
-        response_payload=response_payload,
-        output_text=output_text,
-        request_path=request_path,
-        response_text_path=stored_text.path if stored_text else None,
-        sse_event_path=sse_event_path,
-        cost=cost_breakdown,
-        tokens=usage_breakdown,
+        stream=stream,
+        dry_run=dry_run,
+        use_cache=use_cache,
+        debug_sse=debug_sse,
+        debug_sse_path=debug_sse_path,
+        run_id=run_id,
+        responses_dir=responses_dir,
+        quiet=quiet,
+        on_first_data=on_first_data,
     )
 
 
@@ -937,6 +982,7 @@ def run_gemini_puzzle(
     stream: bool = True,
     special_settings: str | None = None,
     dry_run: bool = False,
+    use_cache: bool = False,
     debug_sse: bool = False,
     debug_sse_path: Path | None = None,
     run_id: str | None = None,
@@ -947,6 +993,21 @@ def run_gemini_puzzle(
     quiet: bool = False,
     on_first_data: Callable[[], None] | None = None,
 ) -> RunResult:
+    # Imported on first use so importing src.runner does not pull in
+    # every provider adapter.
+    from src.providers.gemini import (
+        build_generate_content_request,
+        calculate_cost_breakdown,
+        default_thinking_config_for_model,
+        display_model_name,
+        display_provider_name,
+        extract_usage_breakdown,
+        price_schedule_for_model,
+        require_api_key,
+        send_generate_content_request,
+        supports_reasoning as gemini_supports_reasoning,
+    )
+
     system_prompt, puzzle = _load_fixtures(
         puzzle_name,
         puzzle_dir,
@@ -954,9 +1015,6 @@ def run_gemini_puzzle(
         model=model,
         max_output_tokens=max_output_tokens,
     )
-    created_at = utc_now_iso()
-    run_id = run_id or uuid4().hex
-    provider = "gemini"
     special_settings_label, special_settings_display = _gemini_special_settings(
         explicit=special_settings,
         model=model,
@@ -965,11 +1023,8 @@ def run_gemini_puzzle(
         top_k=top_k,
     )
 
-    if debug_sse and not stream:
-        raise ValueError("debug_sse requires stream=True")
-
     if thinking_config is None and gemini_supports_reasoning(model):
-        thinking_config = gemini_default_thinking_config_for_model(model)
+        thinking_config = default_thinking_config_for_model(model)
 
     request_payload = build_generate_content_request(
         system_prompt=system_prompt.text,
@@ -982,144 +1037,71 @@ def run_gemini_puzzle(
         thinking_config=thinking_config,
     )
 
-    store: ResponseStore | None = None
-    request_path: Path | None = None
-    if not debug_sse:
-        store = ResponseStore(responses_dir or _default_responses_dir())
-        request_path = store.record_request(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            puzzle_name=puzzle.name,
-            puzzle_version=puzzle.version,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
+    def _send(
+        progress_callback: Callable[[int], None] | None,
+        sse_event_path: Path | None,
+    ) -> tuple[Any, str]:
+        streamed_chars = 0
+        forward = (
+            _coalesce_progress(progress_callback) if progress_callback else None
         )
 
-    if dry_run:
-        return RunResult(
-            run_id=run_id,
-            request_payload=request_payload,
-            response_payload=None,
-            output_text="",
-            request_path=request_path,
-            response_text_path=None,
-            sse_event_path=None,
+        def _collect_delta(delta: str) -> None:
+            nonlocal streamed_chars
+            streamed_chars += len(delta)
+            if forward:
+                forward(streamed_chars)
+
+        response = send_generate_content_request(
+            request_payload,
+            api_key=api_key or require_api_key(),
+            stream=stream,
+            stream_text_callback=_collect_delta if stream else None,
+            sse_event_path=sse_event_path,
         )
+        if progress_callback and streamed_chars:
+            # Final count, bypassing the coalescer.
+            progress_callback(streamed_chars)
+        return response.payload, response.output_text
 
-    request_started_at = created_at
-    if not quiet:
-        print(
-            f"requesting puzzle={puzzle.name} model={model}",
-            flush=True,
-        )
     max_tokens = None
     config = request_payload.get("config")
     if isinstance(config, dict):
         max_tokens = config.get("max_output_tokens")
-    progress_callback = _build_progress_callback(
-        max_tokens,
-        suffix="total possible",
-        quiet=quiet,
-        on_first_data=on_first_data,
+    model_alias = display_model_name(model)
+    spec = _ProviderRunSpec(
+        provider="gemini",
+        record_model=model,
+        sse_prefix="gemini",
+        sse_model=model,
+        progress_suffix="total possible",
+        request_notice=f"requesting puzzle={puzzle.name} model={model}",
+        max_tokens=max_tokens,
+        derived_model_alias=model_alias,
+        record_model_alias=model_alias,
+        provider_alias=display_provider_name("gemini"),
+        price_schedule=price_schedule_for_model(model),
+        supports_reasoning=gemini_supports_reasoning(model),
+        special_settings_label=special_settings_label,
+        send=_send,
+        extract_usage=extract_usage_breakdown,
+        calc_cost=functools.partial(calculate_cost_breakdown, model=model),
+        special_settings_display=special_settings_display,
     )
-
-    streamed_chars = {"total": 0}
-
-    def _collect_delta(delta: str) -> None:
-        streamed_chars["total"] += len(delta)
-        if progress_callback:
-            progress_callback(streamed_chars["total"])
-
-    sse_event_path = None
-    if debug_sse:
-        if debug_sse_path is not None:
-            sse_event_path = debug_sse_path
-        else:
-            base_dir = _repo_root() / "tmp"
-            timestamp = _format_timestamp(created_at)
-            sse_event_path = (
-                base_dir / f"gemini-sse-{model}-{run_id}-{timestamp}.jsonl"
-            )
-        if not quiet:
-            print(f"DEBUG MODE: skips responses; writing SSE events to {sse_event_path}")
-
-    response = send_generate_content_request(
-        request_payload,
-        api_key=api_key or require_gemini_api_key(),
+    return _run_puzzle(
+        spec,
+        system_prompt=system_prompt,
+        puzzle=puzzle,
+        request_payload=request_payload,
         stream=stream,
-        stream_text_callback=_collect_delta if stream else None,
-        sse_event_path=sse_event_path,
-    )
-    if not quiet and stream and isinstance(max_tokens, int):
-        print("", flush=True)
-    request_completed_at = utc_now_iso()
-    output_text = response.output_text
-    usage_breakdown = (
-        gemini_extract_usage_breakdown(response.payload)
-        if isinstance(response.payload, dict)
-        else None
-    )
-    cost_breakdown = (
-        gemini_calculate_cost_breakdown(response.payload, model=model)
-        if isinstance(response.payload, dict)
-        else None
-    )
-    supports_reasoning = gemini_supports_reasoning(model)
-    reasoning_disabled = False
-    input_text = format_input_text(system_prompt.text, puzzle.text)
-    derived: dict[str, Any] = {
-        "timing": {
-            "request_started_at": request_started_at,
-            "request_completed_at": request_completed_at,
-        }
-    }
-    price_schedule = gemini_price_schedule_for_model(model)
-    if price_schedule is not None:
-        derived["price_schedule"] = price_schedule
-    derived["model_alias"] = display_gemini_model_name(model)
-    stored_text = None
-    if store is not None:
-        stored_text = store.record_response(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            model_alias=display_gemini_model_name(model),
-            provider_alias=display_gemini_provider_name(provider),
-            puzzle_name=puzzle.name,
-            puzzle_title_prefix="Philosophy problem",
-            puzzle_version=puzzle.version,
-            puzzle_title=puzzle.title,
-            special_settings=special_settings_label,
-            special_settings_display=special_settings_display,
-            request_payload=request_payload,
-            response_payload=response.payload,
-            input_text=input_text,
-            output_text=output_text,
-            derived=derived,
-        )
-    _print_run_summary(
-        response_payload=response.payload if isinstance(response.payload, dict) else None,
-        tokens=usage_breakdown,
-        cost=cost_breakdown,
-        max_output_tokens=max_tokens if isinstance(max_tokens, int) else None,
-        response_text_path=stored_text.path if stored_text else None,
-        supports_reasoning=supports_reasoning,
-        reasoning_disabled=reasoning_disabled,
-        quiet=quiet,
-    )
-    return RunResult(
+        dry_run=dry_run,
+        use_cache=use_cache,
+        debug_sse=debug_sse,
+        debug_sse_path=debug_sse_path,
         run_id=run_id,
-        request_payload=request_payload,
-        response_payload=response.payload,
-        output_text=output_text,
-        request_path=request_path,
-        response_text_path=stored_text.path if stored_text else None,
-        sse_event_path=sse_event_path,
-        cost=cost_breakdown,
-        tokens=usage_breakdown,
+        responses_dir=responses_dir,
+        quiet=quiet,
+        on_first_data=on_first_data,
     )
 
 
@@ -1136,6 +1118,7 @@ def run_anthropic_puzzle(
     stream: bool = True,
     special_settings: str | None = None,
     dry_run: bool = False,
+    use_cache: bool = False,
     debug_sse: bool = False,
     debug_sse_path: Path | None = None,
     run_id: str | None = None,
@@ -1146,6 +1129,23 @@ def run_anthropic_puzzle(
     quiet: bool = False,
     on_first_data: Callable[[], None] | None = None,
 ) -> RunResult:
+    # Imported on first use so importing src.runner does not pull in
+    # every provider adapter.
+    from src.providers.anthropic import (
+        build_messages_request,
+        calculate_cost_breakdown,
+        default_output_config_for_model,
+        default_thinking_config_for_model,
+        display_model_name,
+        display_provider_name,
+        extract_output_text,
+        extract_usage_breakdown,
+        price_schedule_for_model,
+        require_api_key,
+        send_messages_request,
+        supports_reasoning as anthropic_supports_reasoning,
+    )
+
     system_prompt, puzzle = _load_fixtures(
         puzzle_name,
         puzzle_dir,
@@ -1153,18 +1153,12 @@ def run_anthropic_puzzle(
         model=model,
         max_output_tokens=max_output_tokens,
     )
-    created_at = utc_now_iso()
-    run_id = run_id or uuid4().hex
-    provider = "anthropic"
     special_settings_label = normalize_special_settings(special_settings)
 
-    if debug_sse and not stream:
-        raise ValueError("debug_sse requires stream=True")
-
     if thinking is None and anthropic_supports_reasoning(model):
-        thinking = anthropic_default_thinking_config_for_model(model)
+        thinking = default_thinking_config_for_model(model)
     if output_config is None:
-        output_config = anthropic_default_output_config_for_model(model)
+        output_config = default_output_config_for_model(model)
 
     request_payload = build_messages_request(
         system_prompt=system_prompt.text,
@@ -1179,138 +1173,81 @@ def run_anthropic_puzzle(
         stream=stream,
     )
 
-    store: ResponseStore | None = None
-    request_path: Path | None = None
-    if not debug_sse:
-        store = ResponseStore(responses_dir or _default_responses_dir())
-        request_path = store.record_request(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            puzzle_name=puzzle.name,
-            puzzle_version=puzzle.version,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-        )
-
-    if dry_run:
-        return RunResult(
-            run_id=run_id,
-            request_payload=request_payload,
-            response_payload=None,
-            output_text="",
-            request_path=request_path,
-            response_text_path=None,
-            sse_event_path=None,
-        )
-
-    request_started_at = created_at
-    if not quiet:
-        print(
-            f"Requesting model {model} for puzzle '{puzzle.name}'",
-            flush=True,
+    def _send(
+        progress_callback: Callable[[int], None] | None,
+        sse_event_path: Path | None,
+    ) -> tuple[Any, str]:
+        response = send_messages_request(
+            request_payload,
+            api_key=api_key or require_api_key(),
+            progress_callback=(
+                _coalesce_progress(progress_callback) if progress_callback else None
+            ),
+            sse_event_path=sse_event_path,
         )
-    max_tokens = request_payload.get("max_tokens")
-    progress_callback = _build_progress_callback(
-        max_tokens if isinstance(max_tokens, int) else None,
-        suffix="total possible",
+        output_text = response.output_text
+        if not output_text and isinstance(response.payload, dict):
+            output_text = extract_output_text(response.payload)
+        return response.payload, output_text
+
+    model_alias = display_model_name(model)
+    spec = _ProviderRunSpec(
+        provider="anthropic",
+        record_model=model,
+        sse_prefix="anthropic",
+        sse_model=model,
+        progress_suffix="total possible",
+        request_notice=f"Requesting model {model} for puzzle '{puzzle.name}'",
+        max_tokens=request_payload.get("max_tokens"),
+        derived_model_alias=model_alias,
+        record_model_alias=model_alias,
+        provider_alias=display_provider_name("anthropic"),
+        price_schedule=price_schedule_for_model(model),
+        supports_reasoning=anthropic_supports_reasoning(model),
+        special_settings_label=special_settings_label,
+        send=_send,
+        extract_usage=extract_usage_breakdown,
+        calc_cost=functools.partial(calculate_cost_breakdown, model=model),
+        combine_reasoning_from_usage=True,
+    )
+    return _run_puzzle(
+        spec,
+        system_prompt=system_prompt,
+        puzzle=puzzle,
+        request_payload=request_payload,
+        stream=stream,
+        dry_run=dry_run,
+        use_cache=use_cache,
+        debug_sse=debug_sse,
+        debug_sse_path=debug_sse_path,
+        run_id=run_id,
+        responses_dir=responses_dir,
         quiet=quiet,
         on_first_data=on_first_data,
     )
 
-    sse_event_path = None
-    if debug_sse:
-        if debug_sse_path is not None:
-            sse_event_path = debug_sse_path
-        else:
-            base_dir = _repo_root() / "tmp"
-            timestamp = _format_timestamp(created_at)
-            sse_event_path = (
-                base_dir / f"anthropic-sse-{model}-{run_id}-{timestamp}.jsonl"
-            )
-        if not quiet:
-            print(f"DEBUG MODE: skips responses; writing SSE events to {sse_event_path}")
 
-    response = send_messages_request(
-        request_payload,
-        api_key=api_key or require_anthropic_api_key(),
-        progress_callback=progress_callback if stream else None,
-        sse_event_path=sse_event_path,
-    )
-    if not quiet and stream and isinstance(max_tokens, int):
-        print("", flush=True)
-    request_completed_at = utc_now_iso()
-    output_text = response.output_text
-    if not output_text and isinstance(response.payload, dict):
-        output_text = extract_anthropic_output_text(response.payload)
-    usage_breakdown = (
-        anthropic_extract_usage_breakdown(response.payload)
-        if isinstance(response.payload, dict)
-        else None
-    )
-    cost_breakdown = (
-        anthropic_calculate_cost_breakdown(response.payload, model=model)
-        if isinstance(response.payload, dict)
-        else None
-    )
-    supports_reasoning = anthropic_supports_reasoning(model)
-    reasoning_disabled = False
-    combine_reasoning_output = (
-        usage_breakdown is not None
-        and supports_reasoning
-        and usage_breakdown.reasoning_tokens is None
-    )
-    input_text = format_input_text(system_prompt.text, puzzle.text)
-    derived: dict[str, Any] = {
-        "timing": {
-            "request_started_at": request_started_at,
-            "request_completed_at": request_completed_at,
-        }
-    }
-    price_schedule = anthropic_price_schedule_for_model(model)
-    if price_schedule is not None:
-        derived["price_schedule"] = price_schedule
-    derived["model_alias"] = display_anthropic_model_name(model)
-    stored_text = None
-    if store is not None:
-        stored_text = store.record_response(
-            run_id=run_id,
-            created_at=created_at,
-            provider=provider,
-            model=model,
-            model_alias=display_anthropic_model_name(model),
-            provider_alias=display_anthropic_provider_name(provider),
-            puzzle_name=puzzle.name,
-            puzzle_title_prefix="Philosophy problem",
-            puzzle_version=puzzle.version,
-            puzzle_title=puzzle.title,
-            special_settings=special_settings_label,
-            request_payload=request_payload,
-            response_payload=response.payload,
-            input_text=input_text,
-            output_text=output_text,
-            derived=derived,
-        )
-    _print_run_summary(
-        response_payload=response.payload if isinstance(response.payload, dict) else None,
-        tokens=usage_breakdown,
-        cost=cost_breakdown,
-        max_output_tokens=max_tokens if isinstance(max_tokens, int) else None,
-        response_text_path=stored_text.path if stored_text else None,
-        supports_reasoning=supports_reasoning,
-        reasoning_disabled=reasoning_disabled,
-        combine_reasoning_output=combine_reasoning_output,
-        quiet=quiet,
-    )
-    return RunResult(
-        run_id=run_id,
-        request_payload=request_payload,
-        response_payload=response.payload,
-        output_text=output_text,
-        request_path=request_path,
-        response_text_path=stored_text.path if stored_text else None,
-        sse_event_path=sse_event_path,
-        cost=cost_breakdown,
-        tokens=usage_breakdown,
-    )
+# Async bridges: the provider clients underneath are blocking (SDKs and
+# http.client), so the runners are offloaded to worker threads rather than
+# rewritten on an async HTTP stack. Callers can asyncio.gather these to
+# overlap the network wait across puzzles and models.
+
+
+async def arun_openai_puzzle(**kwargs: Any) -> RunResult:
+    return await asyncio.to_thread(run_openai_puzzle, **kwargs)
+
+
+async def arun_fireworks_puzzle(**kwargs: Any) -> RunResult:
+    return await asyncio.to_thread(run_fireworks_puzzle, **kwargs)
+
+
+async def arun_grok_puzzle(**kwargs: Any) -> RunResult:
+    return await asyncio.to_thread(run_grok_puzzle, **kwargs)
+
+
+async def arun_gemini_puzzle(**kwargs: Any) -> RunResult:
+    return await asyncio.to_thread(run_gemini_puzzle, **kwargs)
+
+
+async def arun_anthropic_puzzle(**kwargs: Any) -> RunResult:
+    return await asyncio.to_thread(run_anthropic_puzzle, **kwargs)
@@ -2,25 +2,52 @@
 
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import functools
+import io
 import json
 from pathlib import Path
 import re
-from typing import Any
+import threading
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+except ImportError:
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
 
 @dataclass(frozen=True)
 class StoredText:
     path: Path
-    text: str
+    # Retained for compatibility; the full body is no longer materialized
+    # since the docx writer consumes input/output text directly.
+    text: str = ""
+
+
+# Hoisted so the per-run timestamp calls skip the attribute lookup.
+_UTC = timezone.utc
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(_UTC).isoformat()
+
+
+# Compiled once; _slugify runs per record.
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+_VIA_SUFFIX_RE = re.compile(r"\s*\(via [^)]+\)\s*$")
 
 
 def _slugify(value: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_").lower()
+    cleaned = _SLUG_RE.sub("_", value).strip("_").lower()
     return cleaned or "default"
 
 
@@ -32,14 +59,22 @@ def normalize_special_settings(value: str | None) -> str:
     return _slugify(str(value))
 
 
+@functools.lru_cache(maxsize=64)
 def format_input_text(system_text: str, puzzle_text: str) -> str:
+    # Sweeps pair the same cached prompt with the same cached puzzle, so
+    # the concatenation is allocated once per fixture pair.
     return f"System\n{system_text}\n\nUser\n{puzzle_text}"
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_created_at(created_at: str) -> datetime:
+    # record_response derives both the display date and the filename
+    # timestamp from the same created_at; parse it once.
+    return datetime.fromisoformat(created_at).astimezone(_UTC)
+
+
 def _format_display_date(created_at: str) -> str:
-    timestamp = datetime.fromisoformat(created_at)
-    timestamp = timestamp.astimezone(timezone.utc)
-    return timestamp.strftime("%b %d, %Y")
+    return _parse_created_at(created_at).strftime("%b %d, %Y")
 
 
 def _format_filename_timestamp(created_at: str) -> str:
@@ -47,9 +82,7 @@ def _format_filename_timestamp(created_at: str) -> str:
 
     Returns format like: 2026-01-16T181411Z
     """
-    timestamp = datetime.fromisoformat(created_at)
-    timestamp = timestamp.astimezone(timezone.utc)
-    return timestamp.strftime("%Y-%m-%dT%H%M%SZ")
+    return _parse_created_at(created_at).strftime("%Y-%m-%dT%H%M%SZ")
 
 
 def _simplify_provider_display(provider_display: str) -> str:
@@ -58,7 +91,7 @@ def _simplify_provider_display(provider_display: str) -> str:
     Removes '(via Fireworks)' and similar intermediary suffixes.
     Example: 'Qwen (via Fireworks)' -> 'Qwen'
     """
-    return re.sub(r'\s*\(via [^)]+\)\s*$', '', provider_display).strip()
+    return _VIA_SUFFIX_RE.sub('', provider_display).strip()
 
 
 def _docx_filename(
@@ -83,16 +116,75 @@ def _add_page_number(paragraph, WD_ALIGN_PARAGRAPH, OxmlElement, qn) -> None:
     run._r.append(field)
 
 
-def _add_text_paragraphs(document, text: str) -> None:
-    """Add text paragraphs, treating 'System' and 'User' as h2 headings."""
+def _add_text_paragraphs(document, text: str, OxmlElement, qn) -> None:
+    """Add text paragraphs, treating 'System' and 'User' as h2 headings.
+
+    Paragraph XML is built directly and spliced in as a batch: outputs run
+    to hundreds of lines, and a python-docx add_paragraph call per line
+    dominates the docx write time.
+    """
+    body = document.element.body
+    # New content must land before the trailing section properties.
+    sect_pr = body.find(qn("w:sectPr"))
+
+    def _flush(nodes: list) -> None:
+        if not nodes:
+            return
+        if sect_pr is not None:
+            for node in nodes:
+                sect_pr.addprevious(node)
+        else:
+            body.extend(nodes)
+        nodes.clear()
+
+    pending: list = []
     normalized = text.replace("\r\n", "\n").replace("\r", "\n")
     for line in normalized.split("\n"):
         # Style "System" and "User" labels as headings
         if line in ("System", "User"):
+            _flush(pending)
             document.add_heading(line, level=2)
-        else:
-            # "Normal" is default, but this keeps us explicit
-            document.add_paragraph(line, style="Normal")
+            continue
+        # "Normal" is default, but this keeps us explicit
+        paragraph = OxmlElement("w:p")
+        properties = OxmlElement("w:pPr")
+        style = OxmlElement("w:pStyle")
+        style.set(qn("w:val"), "Normal")
+        properties.append(style)
+        paragraph.append(properties)
+        if line:
+            run = OxmlElement("w:r")
+            text_element = OxmlElement("w:t")
+            text_element.set(qn("xml:space"), "preserve")
+            text_element.text = line
+            run.append(text_element)
+            paragraph.append(run)
+        pending.append(paragraph)
+    _flush(pending)
+
+
+@functools.lru_cache(maxsize=1)
+def _template_docx_bytes() -> bytes:
+    """Serialize the pre-tweaked base document once per process.
+
+    Document() parses the default template and the Normal-style spacing
+    tweak runs the styles machinery; loading the finished template from
+    bytes skips the mutation on every subsequent write.
+    """
+    from docx import Document
+    from docx.shared import Pt
+
+    document = Document()
+    # remove default 'after paragraph' spacing of 10pt, since models typically use 2 line breaks
+    for style_name in ("Normal",):
+        try:
+            style = document.styles[style_name]
+        except KeyError:
+            continue
+        style.paragraph_format.space_after = Pt(0)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
 
 
 def write_response_docx(
@@ -115,16 +207,8 @@ def write_response_docx(
     from docx.oxml import OxmlElement
     from docx.oxml.ns import qn
 
-    document = Document()
+    document = Document(io.BytesIO(_template_docx_bytes()))
     document.core_properties.title = display_name
-    # remove default 'after paragraph' spacing of 10pt, since models typically use 2 line breaks
-    for style_name in ("Normal",):
-        try:
-            style = document.styles[style_name]
-        except KeyError:
-            continue
-        paragraph_format = style.paragraph_format
-        paragraph_format.space_after = Pt(0)
 
     title_paragraph = document.add_paragraph(display_name, style="Title")
     title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -142,10 +226,10 @@ def write_response_docx(
         paragraph.paragraph_format.space_after = Pt(0)
 
     document.add_heading(f"Input given to {model_display}", level=1)
-    _add_text_paragraphs(document, input_text)
+    _add_text_paragraphs(document, input_text, OxmlElement, qn)
     document.add_page_break()
     document.add_heading(f"{model_display}'s Output", level=1)
-    _add_text_paragraphs(document, output_text)
+    _add_text_paragraphs(document, output_text, OxmlElement, qn)
 
     footer = document.sections[0].footer
     footer_paragraph = footer.paragraphs[0]
@@ -181,15 +265,46 @@ class ResponseStore:
 
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
+        self._handles: dict[Path, BinaryIO] = {}
+        self._dirs_ready: set[Path] = set()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
 
     def _provider_dir(self, provider: str, model: str) -> Path:
         return self.base_dir / provider / model
 
     def _append_jsonl(self, path: Path, record: dict[str, Any]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False))
-            handle.write("\n")
+        data = _json_dumps(record) + b"\n"
+        with self._lock:
+            handle = self._handles.get(path)
+            if handle is None:
+                parent = path.parent
+                if parent not in self._dirs_ready:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    self._dirs_ready.add(parent)
+                # Handles stay open for the store's lifetime so each append
+                # costs one write instead of an open/write/close round trip.
+                handle = path.open("ab")
+                self._handles[path] = handle
+            handle.write(data)
+            # Flushing per record keeps the files safe to tail and leaves
+            # nothing buffered if the process dies.
+            handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._handles.values():
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+            self._handles.clear()
+
+    def __enter__(self) -> ResponseStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def record_request(
         self,
@@ -272,19 +387,6 @@ class ResponseStore:
         )
         display_date = _format_display_date(created_at)
         puzzle_prefix = puzzle_title_prefix or "Philosophy problem"
-        text_body = "\n".join(
-            [
-                f"{puzzle_prefix}: {display_name}",
-                f"Model: {model_display} ({provider_display}){settings_display}",
-                f"Completed by {model_display}: {display_date}",
-                "",
-                "---- INPUT ----",
-                input_text,
-                "",
-                f"---- {model_display}'S OUTPUT ----",
-                output_text,
-            ]
-        )
         write_response_docx(
             path=text_path,
             puzzle_prefix=puzzle_prefix,
@@ -297,4 +399,4 @@ class ResponseStore:
             input_text=input_text,
             output_text=output_text,
         )
-        return StoredText(path=text_path, text=text_body)
+        return StoredText(path=text_path)
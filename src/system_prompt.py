@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
+import functools
 from importlib.machinery import SourceFileLoader
 from importlib.util import module_from_spec, spec_from_loader
 from pathlib import Path
 from types import ModuleType
-from typing import Any
 
 
 @dataclass(frozen=True)
@@ -19,12 +20,19 @@ class SystemPrompt:
     path: Path
 
 
+# Resolved once at import; Path.resolve() hits the filesystem.
+_DEFAULT_SYSTEM_PATH = Path(__file__).resolve().parents[1] / "prompts" / "system.py"
+
+
 def _default_system_path() -> Path:
-    return Path(__file__).resolve().parents[1] / "prompts" / "system.py"
+    return _DEFAULT_SYSTEM_PATH
 
 
-def _load_module(path: Path) -> ModuleType:
-    loader = SourceFileLoader(path.stem, str(path))
+@functools.lru_cache(maxsize=8)
+def _load_module_cached(path_str: str, mtime_ns: int) -> ModuleType:
+    # mtime_ns participates in the cache key so an edited file reloads.
+    path = Path(path_str)
+    loader = SourceFileLoader(path.stem, path_str)
     spec = spec_from_loader(path.stem, loader)
     if spec is None:
         raise ImportError(f"Unable to load system prompt module: {path}")
@@ -35,6 +43,10 @@ def _load_module(path: Path) -> ModuleType:
     return module
 
 
+def _load_module(path: Path) -> ModuleType:
+    return _load_module_cached(str(path), path.stat().st_mtime_ns)
+
+
 def _coerce_metadata(value: object) -> dict:
     if value is None:
         return {}
@@ -43,20 +55,33 @@ def _coerce_metadata(value: object) -> dict:
     raise TypeError("PROMPT_METADATA must be a dict if provided")
 
 
+@functools.lru_cache(maxsize=1)
+def _merged_model_defaults() -> dict[str, int | None]:
+    """Merge the per-provider token defaults into one lookup table.
+
+    Built in reverse precedence order so anthropic entries win, matching
+    the old provider-by-provider cascade.
+    """
+    # Local imports to avoid provider dependencies at import time.
+    from src.providers import anthropic, gemini, grok, openai
+
+    merged: dict[str, int | None] = {}
+    for module in (grok, gemini, openai, anthropic):
+        for model, defaults in module.MODEL_DEFAULTS.items():
+            merged[model] = defaults.get("max_output_tokens")
+    return merged
+
+
 def _default_max_output_tokens(model: str | None) -> int | None:
     if not model:
         return None
-    # Local imports to avoid provider dependencies at import time.
-    from src.providers import anthropic, fireworks, gemini, grok, openai
+    merged = _merged_model_defaults()
+    if model in merged:
+        return merged[model]
 
-    if model in anthropic.MODEL_DEFAULTS:
-        return anthropic.MODEL_DEFAULTS[model].get("max_output_tokens")
-    if model in openai.MODEL_DEFAULTS:
-        return openai.MODEL_DEFAULTS[model].get("max_output_tokens")
-    if model in gemini.MODEL_DEFAULTS:
-        return gemini.MODEL_DEFAULTS[model].get("max_output_tokens")
-    if model in grok.MODEL_DEFAULTS:
-        return grok.MODEL_DEFAULTS[model].get("max_output_tokens")
+    # Fireworks keys are aliases that resolve to full model ids, so it
+    # stays a fallback rather than joining the merged table.
+    from src.providers import fireworks
 
     model_id = fireworks.resolve_model(model)
     if model_id in fireworks.MODEL_DEFAULTS:
@@ -64,47 +89,62 @@ def _default_max_output_tokens(model: str | None) -> int | None:
     return None
 
 
-def _length_guidance_sentence(
-    module: ModuleType, max_output_tokens: int | None
-) -> str | None:
-    if max_output_tokens is None:
-        return None
+@functools.lru_cache(maxsize=8)
+def _guidance_table(
+    module: ModuleType,
+) -> tuple[tuple[int, ...], tuple[str, ...], str] | None:
+    """Validate and sort the module's length-guidance table once.
+
+    Returns ascending limits with their labels plus the sentence template,
+    or None when the module opts out or the table is malformed. Module
+    objects are cached by mtime, so an edited prompt gets a fresh entry.
+    """
     table = getattr(module, "OUTPUT_LENGTH_GUIDANCE", None)
     if not isinstance(table, list) or not table:
         return None
     template = getattr(module, "OUTPUT_LENGTH_SENTENCE_TEMPLATE", None)
     if not isinstance(template, str) or not template.strip():
         return None
-    selected: dict[str, Any] | None = None
+    entries: list[tuple[int, str]] = []
     for entry in table:
         if not isinstance(entry, dict):
             continue
         limit = entry.get("max_output_tokens")
         label = entry.get("label")
-        if not isinstance(limit, int) or not isinstance(label, str):
+        if not isinstance(limit, int) or not isinstance(label, str) or not label.strip():
             continue
-        if max_output_tokens <= limit:
-            selected = entry
-            break
-        selected = entry
-    if not selected:
+        entries.append((limit, label))
+    if not entries:
+        return None
+    entries.sort(key=lambda pair: pair[0])
+    limits = tuple(limit for limit, _ in entries)
+    labels = tuple(label for _, label in entries)
+    return limits, labels, template
+
+
+def _length_guidance_sentence(
+    module: ModuleType, max_output_tokens: int | None
+) -> str | None:
+    if max_output_tokens is None:
         return None
-    label = selected.get("label")
-    if not isinstance(label, str) or not label.strip():
+    cached = _guidance_table(module)
+    if cached is None:
         return None
-    return template.format(label=label, max_output_tokens=max_output_tokens)
+    limits, labels, template = cached
+    # First limit that covers the budget, or the largest tier when the
+    # budget exceeds every limit.
+    index = min(bisect.bisect_left(limits, max_output_tokens), len(limits) - 1)
+    return template.format(label=labels[index], max_output_tokens=max_output_tokens)
 
 
-def load_system_prompt(
-    system_path: Path | None = None,
-    *,
-    model: str | None = None,
-    max_output_tokens: int | None = None,
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt_cached(
+    path_str: str, mtime_ns: int, resolved_max_output_tokens: int | None
 ) -> SystemPrompt:
-    path = system_path or _default_system_path()
-    if not path.exists():
-        raise FileNotFoundError(f"System prompt not found: {path}")
-    module = _load_module(path)
+    # Validation and the length-guidance assembly run once per
+    # (file, token budget) pair; batch sweeps reuse the same prompt text.
+    path = Path(path_str)
+    module = _load_module_cached(path_str, mtime_ns)
     if not hasattr(module, "SYSTEM_PROMPT"):
         raise ValueError(f"Missing SYSTEM_PROMPT in {path.name}")
     text = getattr(module, "SYSTEM_PROMPT")
@@ -114,7 +154,6 @@ def load_system_prompt(
     metadata = _coerce_metadata(getattr(module, "PROMPT_METADATA", None))
     name = metadata.get("name") if isinstance(metadata, dict) else None
     version = metadata.get("version") if isinstance(metadata, dict) else None
-    resolved_max_output_tokens = max_output_tokens or _default_max_output_tokens(model)
     length_sentence = _length_guidance_sentence(module, resolved_max_output_tokens)
     if length_sentence:
         text = f"{text.strip()}{length_sentence}"
@@ -126,3 +165,19 @@ def load_system_prompt(
         metadata=metadata,
         path=path,
     )
+
+
+def load_system_prompt(
+    system_path: Path | None = None,
+    *,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> SystemPrompt:
+    path = system_path or _default_system_path()
+    # One stat covers both the existence check and the cache key.
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as exc:
+        raise FileNotFoundError(f"System prompt not found: {path}") from exc
+    resolved_max_output_tokens = max_output_tokens or _default_max_output_tokens(model)
+    return _build_system_prompt_cached(str(path), mtime_ns, resolved_max_output_tokens)
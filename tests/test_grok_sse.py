@@ -0,0 +1,70 @@
+"""Tests for the Grok bytes-level SSE parser."""
+
+from __future__ import annotations
+
+import io
+
+from src.providers.grok import _event_data_bytes, _iter_sse_events
+
+
+def _events(raw: bytes) -> list[dict]:
+    return list(_iter_sse_events(io.BytesIO(raw)))
+
+
+def test_parses_lf_separated_events() -> None:
+    raw = b'data: {"id": "1"}\n\ndata: {"id": "2"}\n\ndata: [DONE]\n\n'
+    assert _events(raw) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_parses_crlf_separated_events() -> None:
+    raw = b'data: {"id": "1"}\r\n\r\ndata: {"id": "2"}\r\n\r\ndata: [DONE]\r\n\r\n'
+    assert _events(raw) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_parses_mixed_line_endings() -> None:
+    raw = b'data: {"id": "1"}\r\n\r\ndata: {"id": "2"}\n\n'
+    assert _events(raw) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_final_event_without_trailing_blank_line() -> None:
+    raw = b'data: {"id": "1"}\n\ndata: {"id": "2"}'
+    assert _events(raw) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_stops_at_done_sentinel() -> None:
+    raw = b'data: {"id": "1"}\n\ndata: [DONE]\n\ndata: {"id": "2"}\n\n'
+    assert _events(raw) == [{"id": "1"}]
+
+
+def test_trailing_done_without_blank_line_is_not_yielded() -> None:
+    raw = b'data: {"id": "1"}\n\ndata: [DONE]'
+    assert _events(raw) == [{"id": "1"}]
+
+
+def test_skips_comment_and_event_lines() -> None:
+    raw = b': keep-alive\n\nevent: message\ndata: {"id": "1"}\n\n'
+    assert _events(raw) == [{"id": "1"}]
+
+
+def test_event_split_across_reads() -> None:
+    # BytesIO.read1 returns at most the requested size, but exercise the
+    # buffering explicitly with a reader that drips one byte at a time.
+    class OneByteReader:
+        def __init__(self, raw: bytes) -> None:
+            self._stream = io.BytesIO(raw)
+
+        def read(self, size: int) -> bytes:
+            return self._stream.read(1)
+
+    raw = b'data: {"id": "1"}\r\n\r\ndata: {"id": "2"}\n\n'
+    assert list(_iter_sse_events(OneByteReader(raw))) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_event_data_bytes_joins_multiple_data_lines() -> None:
+    event = b'data: {"a":\ndata: 1}'
+    assert _event_data_bytes(event) == b'{"a":\n1}'
+
+
+def test_event_data_bytes_ignores_non_data_lines() -> None:
+    assert _event_data_bytes(b"event: message\n: comment") is None
+    assert _event_data_bytes(b"") is None
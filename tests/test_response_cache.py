@@ -0,0 +1,65 @@
+"""Tests for the exact-match response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.response_cache import cache_key, lookup, store
+
+REQUEST = {"model": "o3-2025-04-16", "input": "puzzle text", "max_output_tokens": 100}
+
+
+def test_store_then_lookup_round_trip(tmp_path: Path) -> None:
+    store(tmp_path, "openai", "o3", REQUEST, {"id": "resp_1"}, "output")
+    record = lookup(tmp_path, "openai", "o3", REQUEST)
+    assert record is not None
+    assert record["response"] == {"id": "resp_1"}
+    assert record["output_text"] == "output"
+
+
+def test_lookup_misses_for_different_request(tmp_path: Path) -> None:
+    store(tmp_path, "openai", "o3", REQUEST, {"id": "resp_1"}, "output")
+    changed = {**REQUEST, "input": "other puzzle"}
+    assert lookup(tmp_path, "openai", "o3", changed) is None
+
+
+def test_lookup_misses_for_different_provider_or_model(tmp_path: Path) -> None:
+    store(tmp_path, "openai", "o3", REQUEST, {"id": "resp_1"}, "output")
+    assert lookup(tmp_path, "grok", "o3", REQUEST) is None
+    assert lookup(tmp_path, "openai", "o4", REQUEST) is None
+
+
+def test_lookup_misses_on_empty_cache(tmp_path: Path) -> None:
+    assert lookup(tmp_path, "openai", "o3", REQUEST) is None
+
+
+def test_cache_key_ignores_dict_ordering() -> None:
+    reordered = {"max_output_tokens": 100, "input": "puzzle text", "model": "o3-2025-04-16"}
+    assert cache_key("openai", "o3", REQUEST) == cache_key("openai", "o3", reordered)
+
+
+def test_cache_key_distinguishes_payloads() -> None:
+    assert cache_key("openai", "o3", REQUEST) != cache_key(
+        "openai", "o3", {**REQUEST, "max_output_tokens": 200}
+    )
+
+
+def _record_path(base_dir: Path, provider: str, model: str) -> Path:
+    return base_dir / ".cache" / f"{cache_key(provider, model, REQUEST)}.json"
+
+
+def test_lookup_treats_corrupt_json_as_miss(tmp_path: Path) -> None:
+    store(tmp_path, "openai", "o3", REQUEST, {"id": "resp_1"}, "output")
+    _record_path(tmp_path, "openai", "o3").write_bytes(b'{"response": {"id"')
+    assert lookup(tmp_path, "openai", "o3", REQUEST) is None
+
+
+def test_lookup_treats_missing_keys_as_miss(tmp_path: Path) -> None:
+    store(tmp_path, "openai", "o3", REQUEST, {"id": "resp_1"}, "output")
+    path = _record_path(tmp_path, "openai", "o3")
+    path.write_bytes(b'{"response": {"id": "resp_1"}}')
+    assert lookup(tmp_path, "openai", "o3", REQUEST) is None
+    path.write_bytes(b'{"output_text": "output"}')
+    assert lookup(tmp_path, "openai", "o3", REQUEST) is None
+    path.write_bytes(b'["not", "a", "record"]')
+    assert lookup(tmp_path, "openai", "o3", REQUEST) is None